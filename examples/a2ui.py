@@ -15,35 +15,240 @@ Usage:
     python a2ui_agent.py              # Normal mode
     python a2ui_agent.py --verbose    # Verbose mode with debug logs
     python a2ui_agent.py -i           # Interactive mode
+    python a2ui_agent.py -i --cache   # Interactive mode with semantic cache
+                                      # and product-list fast path
 """
 
 import asyncio
 import json
+import math
 import os
+import re
 import sys
+from typing import Any
 
-from langchain_openai import ChatOpenAI
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langgraph.prebuilt import create_react_agent
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+)
 
-from langchain_ucp import UCPToolkit, Product
+from langchain_ucp import UCPToolkit, Product, UCPStore
 from langchain_ucp.a2ui import (
     get_a2ui_system_prompt,
     parse_a2ui_response,
     create_product_list,
+    validate_a2ui_json,
     A2UI_DELIMITER,
 )
+from langchain_ucp.a2ui.constants import SURFACE_ID_PRODUCTS
+
+# History trimming and summarization are shared with the interactive chat example
+from interactive_chat import MAX_HISTORY_MESSAGES, split_history, summarize
 
 
 # Define your product catalog
-PRODUCTS = [
+PRODUCTS = (
     Product(id="bouquet_roses", title="Bouquet of Red Roses"),
     Product(id="bouquet_sunflowers", title="Sunflower Bundle"),
     Product(id="bouquet_tulips", title="Spring Tulips"),
     Product(id="orchid_white", title="White Orchid"),
     Product(id="pot_ceramic", title="Ceramic Pot"),
     Product(id="gardenias", title="Gardenias"),
-]
+)
+
+
+class SemanticCache:
+    """Cache agent responses keyed by the meaning of the user message.
+
+    Messages are embedded and compared by cosine similarity against
+    previously answered ones; a close enough match returns the stored
+    response without invoking the agent.
+
+    Cached responses skip tool calls entirely, so only turns that did
+    nothing but search the catalog are stored (see ``is_cacheable_turn``).
+    Callers should embed the message together with the previous reply, so
+    short follow-ups like "yes" only match in the same context.
+    """
+
+    def __init__(self, embeddings: OpenAIEmbeddings, threshold: float = 0.92):
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self._vectors: list[list[float]] = []
+        self._responses: list[str] = []
+
+    async def embed(self, text: str) -> list[float]:
+        """Embed text as a unit vector so dot product equals cosine."""
+        vector = await self.embeddings.aembed_query(text)
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def lookup(self, vector: list[float]) -> str | None:
+        """Return the cached response closest to vector, if above threshold."""
+        best_response = None
+        best_score = self.threshold
+        for cached, response in zip(self._vectors, self._responses):
+            score = sum(a * b for a, b in zip(vector, cached))
+            if score >= best_score:
+                best_score = score
+                best_response = response
+        return best_response
+
+    def store(self, vector: list[float], response: str) -> None:
+        """Remember the response for an embedded message."""
+        self._vectors.append(vector)
+        self._responses.append(response)
+
+
+# Replaying a cached reply skips its tool calls, so only turns that used
+# nothing but these read-only, session-independent tools may be cached.
+CACHEABLE_TOOLS = frozenset({"search_shopping_catalog"})
+
+
+def is_cacheable_turn(messages: list[BaseMessage]) -> bool:
+    """Check if a turn only searched the catalog, so replaying it is safe.
+
+    Turns without tool calls are not cached either: their replies depend
+    on the conversation (e.g. answering "yes") rather than the catalog.
+    """
+    tool_names = [
+        call["name"]
+        for message in messages
+        if isinstance(message, AIMessage)
+        for call in message.tool_calls
+    ]
+    return bool(tool_names) and all(name in CACHEABLE_TOOLS for name in tool_names)
+
+
+def cache_key(history: list[BaseMessage], user_input: str) -> str:
+    """Text to embed for the cache: the user message in its reply context."""
+    for message in reversed(history):
+        if isinstance(message, AIMessage) and not message.tool_calls:
+            previous, _ = parse_a2ui_response(message.content)
+            return f"{previous}\n\n{user_input}"
+    return user_input
+
+
+class PromptCluster:
+    """A group of semantically similar prompts seen by the agent."""
+
+    def __init__(self, vector: list[float]):
+        self.centroid = vector
+        self.samples = 0
+        self.product_lists = 0
+
+    def add(self, vector: list[float], is_product_list: bool) -> None:
+        """Fold a sample into the cluster, keeping the centroid normalized."""
+        self.samples += 1
+        self.product_lists += is_product_list
+        weight = 1 / self.samples
+        merged = [c + (v - c) * weight for c, v in zip(self.centroid, vector)]
+        norm = math.sqrt(sum(m * m for m in merged)) or 1.0
+        self.centroid = [m / norm for m in merged]
+
+
+# Words that carry no product information. Catalog search matches
+# substrings, so leaving them in (e.g. "a", "me") would match most titles.
+STOP_WORDS = frozenset({
+    "a", "an", "and", "any", "are", "can", "do", "find", "for", "get",
+    "have", "i", "in", "is", "like", "looking", "me", "my", "need", "of",
+    "please", "search", "see", "show", "some", "the", "to", "want", "what",
+    "with", "you", "your",
+})
+MIN_KEYWORD_LENGTH = 3
+
+
+def product_keywords(query: str) -> str:
+    """Extract the product keywords (slot values) from a user prompt."""
+    words = re.findall(r"[a-z0-9_-]+", query.lower())
+    return " ".join(
+        word
+        for word in words
+        if len(word) >= MIN_KEYWORD_LENGTH and word not in STOP_WORDS
+    )
+
+
+class ProductListFastPath:
+    """Graduate recurring product-list prompts from the LLM to a template.
+
+    Prompts are clustered by embedding similarity. Once a cluster has
+    produced at least ``min_samples`` responses and every one of them
+    rendered a product list, later prompts in that cluster are answered
+    by searching the catalog for the prompt's product keywords and
+    rendering the result with ``create_product_list`` - no LLM call.
+    Prompts without keywords or without matches still go to the agent.
+    """
+
+    def __init__(
+        self,
+        store: UCPStore,
+        threshold: float = 0.9,
+        min_samples: int = 10,
+    ):
+        self.store = store
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.clusters: list[PromptCluster] = []
+
+    def _nearest(self, vector: list[float]) -> PromptCluster | None:
+        best_cluster = None
+        best_score = self.threshold
+        for cluster in self.clusters:
+            score = sum(a * b for a, b in zip(vector, cluster.centroid))
+            if score >= best_score:
+                best_score = score
+                best_cluster = cluster
+        return best_cluster
+
+    def record(self, vector: list[float], response: str) -> None:
+        """Record an agent response for the prompt embedded as vector."""
+        _, a2ui_messages = parse_a2ui_response(response)
+        is_product_list = bool(a2ui_messages) and any(
+            message.get("surfaceUpdate", {}).get("surfaceId") == SURFACE_ID_PRODUCTS
+            for message in a2ui_messages
+        )
+        cluster = self._nearest(vector)
+        if cluster is None:
+            cluster = PromptCluster(vector)
+            self.clusters.append(cluster)
+        cluster.add(vector, is_product_list)
+
+    def render(self, vector: list[float], query: str) -> str | None:
+        """Render a response without the LLM if the prompt's cluster qualifies."""
+        cluster = self._nearest(vector)
+        if (
+            cluster is None
+            or cluster.samples < self.min_samples
+            or cluster.product_lists != cluster.samples
+        ):
+            return None
+
+        keywords = product_keywords(query)
+        if not keywords:
+            return None
+
+        result = self.store.search_products(keywords, fallback_to_all=False)
+        if not result.products:
+            return None
+
+        products = [
+            {"id": p.id, "name": p.title, "imageUrl": p.image_url or ""}
+            for p in result.products
+        ]
+        payload = json.dumps(create_product_list(title="Search Results", products=products))
+
+        # Sanity check the generated payload before bypassing the agent
+        is_valid, _, _ = validate_a2ui_json(payload)
+        if not is_valid:
+            return None
+
+        return (
+            f"Here are {result.total} product(s) I found for you!\n\n"
+            f"{A2UI_DELIMITER}\n{payload}"
+        )
 
 
 def get_system_prompt() -> str:
@@ -68,6 +273,87 @@ This provides a much better shopping experience than plain text.
     )
 
 
+# The system prompt is fully static, so build the message once and reuse it.
+# Keeping it byte-identical across turns lets provider-side prompt caching
+# hit on the large schema/examples prefix. Put any per-turn context in a
+# separate, later message rather than editing this one.
+SYSTEM_MESSAGE = SystemMessage(content=get_system_prompt())
+
+
+async def stream_response(
+    agent: Any, messages: list[BaseMessage]
+) -> list[BaseMessage]:
+    """Stream the agent's reply to stdout, hiding the A2UI JSON part.
+
+    Text is printed as tokens arrive. Once the A2UI delimiter shows up,
+    the rest of the output (the JSON payload) is no longer printed; it is
+    parsed from the final response instead.
+
+    Returns:
+        The full message list from the agent's final state.
+    """
+    keep = len(A2UI_DELIMITER) - 1
+    buffer = ""
+    printed = 0
+    hidden = False
+    result: list[BaseMessage] = messages
+
+    async for event in agent.astream_events({"messages": messages}, version="v2"):
+        kind = event["event"]
+        if kind == "on_chat_model_start":
+            buffer, printed, hidden = "", 0, False
+        elif kind == "on_chat_model_stream" and not hidden:
+            content = event["data"]["chunk"].content
+            if not isinstance(content, str):
+                continue
+            buffer += content
+            # Hold back a delimiter-sized tail that may be a partial match
+            cut = buffer.find(A2UI_DELIMITER, printed)
+            hidden = cut != -1
+            end = cut if hidden else len(buffer) - keep
+            if end > printed:
+                print(buffer[printed:end], end="", flush=True)
+                printed = end
+        elif kind == "on_chat_model_end" and not hidden:
+            print(buffer[printed:], end="", flush=True)
+            printed = len(buffer)
+        elif kind == "on_chain_end" and not event["parent_ids"]:
+            result = event["data"]["output"]["messages"]
+
+    return result
+
+
+# Shared toolkit and agent, created once and reused by every run
+_toolkit: UCPToolkit | None = None
+_agent: Any = None
+_agent_lock = asyncio.Lock()
+
+
+async def get_agent() -> tuple[UCPToolkit, Any]:
+    """Get the shared toolkit and agent, creating them on first use."""
+    global _toolkit, _agent
+    async with _agent_lock:
+        if _agent is None:
+            verbose = "--verbose" in sys.argv or "-v" in sys.argv
+            _toolkit = UCPToolkit(
+                merchant_url="http://localhost:8000",
+                products=PRODUCTS,
+                verbose=verbose,
+            )
+            llm = ChatOpenAI(model="gpt-4o", temperature=0.7)
+            _agent = create_react_agent(llm, _toolkit.get_tools())
+    return _toolkit, _agent
+
+
+async def close_agent() -> None:
+    """Close the shared toolkit and drop the cached agent."""
+    global _toolkit, _agent
+    if _toolkit is not None:
+        await _toolkit.close()
+    _toolkit = None
+    _agent = None
+
+
 async def main():
     """Run a simple demonstration of the A2UI agent."""
     # Check for API key
@@ -78,18 +364,23 @@ async def main():
     # Check for verbose flag
     verbose = "--verbose" in sys.argv or "-v" in sys.argv
 
-    # Create toolkit
-    toolkit = UCPToolkit(
-        merchant_url="http://localhost:8000",
-        products=PRODUCTS,
-        verbose=verbose,
-    )
+    # Get the shared toolkit and agent
+    _, agent = await get_agent()
 
-    # Create agent with system prompt
-    llm = ChatOpenAI(model="gpt-4o", temperature=0.7)
-    agent = create_react_agent(
-        llm,
-        toolkit.get_tools(),
+    # Build the programmatic product list (Example 2) in a worker thread
+    # so it overlaps with the LLM round-trip below
+    products_data = [
+        {"id": "roses", "name": "Red Roses", "price": "$29.99", "imageUrl": "https://example.com/roses.jpg"},
+        {"id": "tulips", "name": "Spring Tulips", "price": "$19.99", "imageUrl": "https://example.com/tulips.jpg"},
+        {"id": "orchid", "name": "White Orchid", "price": "$39.99", "imageUrl": "https://example.com/orchid.jpg"},
+    ]
+    template_task = asyncio.create_task(
+        asyncio.to_thread(
+            create_product_list,
+            title="Featured Flowers",
+            products=products_data,
+            primary_color="#E91E63",
+        )
     )
 
     print("=" * 60)
@@ -103,22 +394,26 @@ async def main():
     print("Example: Requesting product display...")
     result = await agent.ainvoke({
         "messages": [
-            SystemMessage(content=get_system_prompt()),
+            SYSTEM_MESSAGE,
             HumanMessage(content="Show me available flowers")
         ]
     })
 
     response = result["messages"][-1].content
-    print("\nRaw LLM response:")
-    print("-" * 40)
-    print(response[:500] + "..." if len(response) > 500 else response)
-    print("-" * 40)
+    if verbose:
+        print("\nRaw LLM response:")
+        print("-" * 40)
+        print(response[:500] + ("..." if len(response) > 500 else ""))
+        print("-" * 40)
 
     # Parse A2UI from response
     text_content, a2ui_messages = parse_a2ui_response(response)
 
     print("\nParsed content:")
-    print(f"  Text: {text_content[:200]}..." if text_content else "  Text: (none)")
+    if text_content:
+        print(f"  Text: {text_content[:200]}" + ("..." if len(text_content) > 200 else ""))
+    else:
+        print("  Text: (none)")
     
     if a2ui_messages:
         print(f"\n  A2UI: {len(a2ui_messages)} messages")
@@ -133,25 +428,12 @@ async def main():
 
     # Example 2: Create a product list programmatically
     print("\nExample 2: Creating product list programmatically...")
-    
-    products_data = [
-        {"id": "roses", "name": "Red Roses", "price": "$29.99", "imageUrl": "https://example.com/roses.jpg"},
-        {"id": "tulips", "name": "Spring Tulips", "price": "$19.99", "imageUrl": "https://example.com/tulips.jpg"},
-        {"id": "orchid", "name": "White Orchid", "price": "$39.99", "imageUrl": "https://example.com/orchid.jpg"},
-    ]
-    
-    a2ui_payload = create_product_list(
-        title="Featured Flowers",
-        products=products_data,
-        primary_color="#E91E63",
-    )
-    
+
+    a2ui_payload = await template_task
+
     print("\nProgrammatically generated A2UI:")
     print(json.dumps(a2ui_payload, indent=2))
 
-    # Cleanup
-    await toolkit.close()
-
 
 async def interactive_mode():
     """Run in interactive chat mode."""
@@ -159,16 +441,12 @@ async def interactive_mode():
         print("Please set OPENAI_API_KEY environment variable")
         return
 
-    verbose = "--verbose" in sys.argv or "-v" in sys.argv
-
-    toolkit = UCPToolkit(
-        merchant_url="http://localhost:8000",
-        products=PRODUCTS,
-        verbose=verbose,
-    )
+    use_cache = "--cache" in sys.argv
 
-    llm = ChatOpenAI(model="gpt-4o", temperature=0.7)
-    agent = create_react_agent(llm, toolkit.get_tools())
+    toolkit, agent = await get_agent()
+    summary_llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    cache = SemanticCache(OpenAIEmbeddings()) if use_cache else None
+    fast_path = ProductListFastPath(toolkit.store) if use_cache else None
 
     print("=" * 60)
     print("A2UI Shopping Agent - Interactive Mode")
@@ -176,7 +454,11 @@ async def interactive_mode():
     print(f"A2UI delimiter: {A2UI_DELIMITER}")
     print("Type 'quit' to exit\n")
 
-    messages = [SystemMessage(content=get_system_prompt())]
+    # The static system message is always sent first; only the history
+    # after it is trimmed and summarized.
+    history: list[BaseMessage] = []
+    summary_task: asyncio.Task | None = None
+    summarized_count = 0
     last_a2ui = None
 
     while True:
@@ -197,16 +479,49 @@ async def interactive_mode():
                     print("\nNo A2UI payload generated yet.")
                 continue
 
-            messages.append(HumanMessage(content=user_input))
-            
-            result = await agent.ainvoke({"messages": messages})
-            
-            response = result["messages"][-1].content
+            # Swap in the summary of older turns once it is ready
+            if summary_task is not None and summary_task.done():
+                try:
+                    history = [summary_task.result()] + history[summarized_count:]
+                except Exception:
+                    pass
+                summary_task = None
+
+            response = None
+            if cache is not None:
+                vector = await cache.embed(cache_key(history, user_input))
+                response = fast_path.render(vector, user_input) or cache.lookup(vector)
+
+            history.append(HumanMessage(content=user_input))
+
+            streamed = response is None
+            if streamed:
+                print("\nAssistant: ", end="", flush=True)
+                sent = [SYSTEM_MESSAGE, *history]
+                messages = await stream_response(agent, sent)
+                response = messages[-1].content
+                print("\n")
+                if cache is not None:
+                    if is_cacheable_turn(messages[len(sent):]):
+                        cache.store(vector, response)
+                    fast_path.record(vector, response)
+                # Keep the whole turn (tool calls, results and the reply) so
+                # the agent and the summarizer see the real conversation
+                history = messages[1:]
+            else:
+                history.append(AIMessage(content=response))
+
+            # Summarize the older half in the background while the user types
+            if summary_task is None and len(history) > MAX_HISTORY_MESSAGES:
+                older, _ = split_history(history, MAX_HISTORY_MESSAGES // 2)
+                if older:
+                    summarized_count = len(older)
+                    summary_task = asyncio.create_task(summarize(summary_llm, older))
             
             # Parse A2UI from response
             text_content, a2ui_messages = parse_a2ui_response(response)
             
-            if text_content:
+            if text_content and not streamed:
                 print(f"\nAssistant: {text_content}\n")
             
             if a2ui_messages:
@@ -218,12 +533,19 @@ async def interactive_mode():
         except Exception as e:
             print(f"Error: {e}")
 
-    await toolkit.close()
     print("\nGoodbye!")
 
 
+async def run() -> None:
+    """Run the selected mode and release the shared toolkit afterwards."""
+    try:
+        if "--interactive" in sys.argv or "-i" in sys.argv:
+            await interactive_mode()
+        else:
+            await main()
+    finally:
+        await close_agent()
+
+
 if __name__ == "__main__":
-    if "--interactive" in sys.argv or "-i" in sys.argv:
-        asyncio.run(interactive_mode())
-    else:
-        asyncio.run(main())
+    asyncio.run(run())
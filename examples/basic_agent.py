@@ -8,11 +8,13 @@ Prerequisites:
 Usage:
     python basic_agent.py              # Normal mode
     python basic_agent.py --verbose    # Verbose mode with debug logs
+    python basic_agent.py --batch      # Run several prompts in one batch
 """
 
 import asyncio
 import os
 import sys
+from typing import Any
 
 from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
@@ -23,14 +25,87 @@ from langchain_ucp import UCPToolkit, Product
 
 # Define your product catalog (for agent-side discovery)
 # Full product details come from the merchant via UCP
-PRODUCTS = [
+PRODUCTS = (
     Product(id="bouquet_roses", title="Bouquet of Red Roses"),
     Product(id="bouquet_sunflowers", title="Sunflower Bundle"),
     Product(id="bouquet_tulips", title="Spring Tulips"),
     Product(id="orchid_white", title="White Orchid"),
     Product(id="pot_ceramic", title="Ceramic Pot"),
     Product(id="gardenias", title="Gardenias"),
-]
+)
+
+
+async def run_batch_async(
+    agent: Any,
+    prompts: list[str],
+    max_concurrency: int = 16,
+) -> list[str]:
+    """Run several independent prompts through the agent in one batch.
+
+    Note: all prompts share the toolkit's checkout session, so batch
+    read-only requests (e.g. catalog searches) rather than cart changes.
+    """
+    results = await agent.abatch(
+        [{"messages": [HumanMessage(content=prompt)]} for prompt in prompts],
+        config={"max_concurrency": max_concurrency},
+    )
+    return [result["messages"][-1].content for result in results]
+
+
+class PromptBatcher:
+    """Coalesce prompts submitted close together into a single abatch call.
+
+    Callers await ``submit``; prompts arriving within ``window`` seconds of
+    each other are dispatched together via ``run_batch_async``. A caller
+    that is cancelled or times out simply has its result dropped.
+    """
+
+    def __init__(self, agent: Any, window: float = 0.02, max_batch: int = 16):
+        self.agent = agent
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+
+    async def submit(self, prompt: str) -> str:
+        """Queue a prompt and wait for its response."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, future))
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(self.window)
+            while not self._queue.empty() and len(batch) < self.max_batch:
+                batch.append(self._queue.get_nowait())
+
+            # Skip prompts whose callers already gave up waiting
+            batch = [(prompt, future) for prompt, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            prompts = [prompt for prompt, _ in batch]
+            try:
+                responses = await run_batch_async(
+                    self.agent, prompts, max_concurrency=self.max_batch
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+
+    async def close(self) -> None:
+        """Stop the background dispatcher."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
 
 
 async def main():
@@ -53,13 +128,28 @@ async def main():
     llm = ChatOpenAI(model="gpt-4o", temperature=0.7)
     agent = create_react_agent(llm, toolkit.get_tools())
 
-    # Run agent
-    result = await agent.ainvoke({
-        "messages": [HumanMessage(content="Search for roses and add them to my cart")]
-    })
-
-    # Print response
-    print(result["messages"][-1].content)
+    if "--batch" in sys.argv:
+        # Submit several independent prompts concurrently; the batcher
+        # coalesces them into a single abatch call
+        prompts = ["Search for roses", "Search for tulips", "Search for orchids"]
+        batcher = PromptBatcher(agent)
+        try:
+            responses = await asyncio.gather(
+                *(batcher.submit(prompt) for prompt in prompts)
+            )
+        finally:
+            await batcher.close()
+        for response in responses:
+            print(response)
+            print("-" * 40)
+    else:
+        # Run agent
+        result = await agent.ainvoke({
+            "messages": [HumanMessage(content="Search for roses and add them to my cart")]
+        })
+
+        # Print response
+        print(result["messages"][-1].content)
 
     # Cleanup
     await toolkit.close()
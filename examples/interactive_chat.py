@@ -16,21 +16,74 @@ import sys
 
 from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 
 from langchain_ucp import UCPToolkit, Product
 
 
 # Define your product catalog (for agent-side discovery)
 # Full product details come from the merchant via UCP
-PRODUCTS = [
+PRODUCTS = (
     Product(id="bouquet_roses", title="Bouquet of Red Roses"),
     Product(id="bouquet_sunflowers", title="Sunflower Bundle"),
     Product(id="bouquet_tulips", title="Spring Tulips"),
     Product(id="orchid_white", title="White Orchid"),
     Product(id="pot_ceramic", title="Ceramic Pot"),
     Product(id="gardenias", title="Gardenias"),
-]
+)
+
+
+# Conversation history is capped at roughly this many messages; older
+# turns are folded into a running summary so each request stays small.
+MAX_HISTORY_MESSAGES = 20
+
+SUMMARY_PROMPT = (
+    "Summarize this shopping conversation in a few sentences. Keep product "
+    "IDs, cart contents, checkout IDs and any customer details verbatim."
+)
+
+
+def split_history(
+    messages: list[BaseMessage], keep: int
+) -> tuple[list[BaseMessage], list[BaseMessage]]:
+    """Split history into (older, recent) at a user-turn boundary.
+
+    Cutting only before a HumanMessage keeps tool calls and their results
+    together in the same half.
+    """
+    cut = len(messages) - keep
+    while cut > 0 and not isinstance(messages[cut], HumanMessage):
+        cut -= 1
+    return messages[:cut], messages[cut:]
+
+
+async def summarize(llm: ChatOpenAI, messages: list[BaseMessage]) -> SystemMessage:
+    """Condense older conversation turns into a single system message."""
+    transcript = "\n".join(
+        f"{message.type}: {message.content}" for message in messages if message.content
+    )
+    summary = await llm.ainvoke(
+        [SystemMessage(content=SUMMARY_PROMPT), HumanMessage(content=transcript)]
+    )
+    return SystemMessage(content=f"Summary of the earlier conversation:\n{summary.content}")
+
+
+async def stream_turn(agent, messages: list[BaseMessage]) -> list[BaseMessage]:
+    """Stream the agent's reply to stdout as tokens arrive.
+
+    Returns:
+        The full message list from the agent's final state.
+    """
+    result: list[BaseMessage] = messages
+    async for event in agent.astream_events({"messages": messages}, version="v2"):
+        kind = event["event"]
+        if kind == "on_chat_model_stream":
+            content = event["data"]["chunk"].content
+            if isinstance(content, str):
+                print(content, end="", flush=True)
+        elif kind == "on_chain_end" and not event["parent_ids"]:
+            result = event["data"]["output"]["messages"]
+    return result
 
 
 async def main():
@@ -48,9 +101,12 @@ async def main():
         verbose=verbose,
     )
     llm = ChatOpenAI(model="gpt-4o", temperature=0.7)
+    summary_llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
     agent = create_react_agent(llm, toolkit.get_tools())
 
     messages = []
+    summary_task: asyncio.Task | None = None
+    summarized_count = 0
 
     print("\n" + "=" * 50)
     print("UCP Shopping Assistant")
@@ -68,14 +124,26 @@ async def main():
             if not user_input:
                 continue
 
-            messages.append(HumanMessage(content=user_input))
+            # Swap in the summary of older turns once it is ready
+            if summary_task is not None and summary_task.done():
+                try:
+                    messages = [summary_task.result()] + messages[summarized_count:]
+                except Exception:
+                    pass
+                summary_task = None
 
-            result = await agent.ainvoke({"messages": messages})
+            messages.append(HumanMessage(content=user_input))
 
-            response = result["messages"][-1].content
-            print(f"\nAssistant: {response}\n")
+            print("\nAssistant: ", end="", flush=True)
+            messages = await stream_turn(agent, messages)
+            print("\n")
 
-            messages = result["messages"]
+            # Summarize the older half in the background while the user types
+            if summary_task is None and len(messages) > MAX_HISTORY_MESSAGES:
+                older, _ = split_history(messages, MAX_HISTORY_MESSAGES // 2)
+                if older:
+                    summarized_count = len(older)
+                    summary_task = asyncio.create_task(summarize(summary_llm, older))
 
         except KeyboardInterrupt:
             print("\nGoodbye!")
@@ -25,28 +25,74 @@ With A2UI (Agent-to-User Interface) support:
     >>> # Agent can now use send_a2ui_to_client tool to render rich UIs
 """
 
-from langchain_ucp.client import UCPClient
-from langchain_ucp.exceptions import (
-    UCPError,
-    UCPNotFoundError,
-    UCPRequestError,
-    UCPValidationError,
-    UCPVersionError,
-)
-from langchain_ucp.store import Product, UCPStore
-from langchain_ucp.toolkit import UCPToolkit
-from langchain_ucp.tools import (
-    AddToCheckoutTool,
-    CancelCheckoutTool,
-    CompleteCheckoutTool,
-    GetCheckoutTool,
-    GetOrderTool,
-    RemoveFromCheckoutTool,
-    SearchCatalogTool,
-    StartPaymentTool,
-    UpdateCheckoutTool,
-    UpdateCustomerDetailsTool,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from langchain_ucp.client import UCPClient
+    from langchain_ucp.exceptions import (
+        UCPError,
+        UCPNotFoundError,
+        UCPRequestError,
+        UCPValidationError,
+        UCPVersionError,
+    )
+    from langchain_ucp.store import Product, UCPStore
+    from langchain_ucp.toolkit import UCPToolkit
+    from langchain_ucp.tools import (
+        AddManyToCheckoutTool,
+        AddToCheckoutTool,
+        CancelCheckoutTool,
+        CompleteCheckoutTool,
+        GetCheckoutTool,
+        GetOrderTool,
+        RemoveFromCheckoutTool,
+        SearchCatalogTool,
+        StartPaymentTool,
+        UpdateCheckoutTool,
+        UpdateCustomerDetailsTool,
+    )
+
+# Public names are imported on first access (PEP 562) so that importing the
+# package, or a light submodule like langchain_ucp.a2ui, does not pull in
+# httpx, ucp_sdk and langchain_core up front.
+_LAZY_IMPORTS = {
+    "UCPClient": "langchain_ucp.client",
+    "UCPError": "langchain_ucp.exceptions",
+    "UCPNotFoundError": "langchain_ucp.exceptions",
+    "UCPRequestError": "langchain_ucp.exceptions",
+    "UCPValidationError": "langchain_ucp.exceptions",
+    "UCPVersionError": "langchain_ucp.exceptions",
+    "Product": "langchain_ucp.store",
+    "UCPStore": "langchain_ucp.store",
+    "UCPToolkit": "langchain_ucp.toolkit",
+    "AddManyToCheckoutTool": "langchain_ucp.tools",
+    "AddToCheckoutTool": "langchain_ucp.tools",
+    "CancelCheckoutTool": "langchain_ucp.tools",
+    "CompleteCheckoutTool": "langchain_ucp.tools",
+    "GetCheckoutTool": "langchain_ucp.tools",
+    "GetOrderTool": "langchain_ucp.tools",
+    "RemoveFromCheckoutTool": "langchain_ucp.tools",
+    "SearchCatalogTool": "langchain_ucp.tools",
+    "StartPaymentTool": "langchain_ucp.tools",
+    "UpdateCheckoutTool": "langchain_ucp.tools",
+    "UpdateCustomerDetailsTool": "langchain_ucp.tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __version__ = "0.2.0"
 
@@ -66,6 +112,7 @@ __all__ = [
     # Individual tools
     "SearchCatalogTool",
     "AddToCheckoutTool",
+    "AddManyToCheckoutTool",
     "RemoveFromCheckoutTool",
     "UpdateCheckoutTool",
     "GetCheckoutTool",
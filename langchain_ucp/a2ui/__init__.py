@@ -29,7 +29,10 @@ from langchain_ucp.a2ui.constants import (
     STANDARD_CATALOG_ID,
 )
 from langchain_ucp.a2ui.schema import (
+    A2UI_ARRAY_VALIDATOR,
+    A2UI_MESSAGE_ARRAY_SCHEMA,
     A2UI_MESSAGE_SCHEMA,
+    A2UI_MESSAGE_VALIDATOR,
     A2UI_STANDARD_CATALOG,
     wrap_as_json_array,
 )
@@ -55,7 +58,9 @@ from langchain_ucp.a2ui.templates import (
     CheckoutTemplate,
     OrderConfirmationTemplate,
     create_product_card,
+    create_product_card_bytes,
     create_product_list,
+    create_product_list_bytes,
     create_checkout_ui,
     create_order_confirmation,
 )
@@ -69,7 +74,10 @@ __all__ = [
     "A2UI_DELIMITER",
     # Schema
     "A2UI_MESSAGE_SCHEMA",
+    "A2UI_MESSAGE_ARRAY_SCHEMA",
     "A2UI_STANDARD_CATALOG",
+    "A2UI_MESSAGE_VALIDATOR",
+    "A2UI_ARRAY_VALIDATOR",
     "wrap_as_json_array",
     # Types
     "A2UIMessage",
@@ -90,7 +98,9 @@ __all__ = [
     "CheckoutTemplate",
     "OrderConfirmationTemplate",
     "create_product_card",
+    "create_product_card_bytes",
     "create_product_list",
+    "create_product_list_bytes",
     "create_checkout_ui",
     "create_order_confirmation",
 ]
@@ -0,0 +1,242 @@
+"""Compiled A2UI message array validator.
+
+Generated by tools/compile_a2ui_schema.py - do not edit by hand.
+"""
+# ruff: noqa
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (list, tuple)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be array", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'array', 'items': {'title': 'A2UI Message Schema', 'description': 'Describes a JSON payload for an A2UI (Agent to UI) message.', 'type': 'object', 'additionalProperties': False, 'properties': {'beginRendering': {'type': 'object', 'description': 'Signals the client to begin rendering a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The unique identifier for the UI surface.'}, 'catalogId': {'type': 'string', 'description': 'The identifier of the component catalog to use.'}, 'root': {'type': 'string', 'description': 'The ID of the root component to render.'}, 'styles': {'type': 'object', 'description': 'Styling information for the UI.', 'additionalProperties': True}}, 'required': ['root', 'surfaceId']}, 'surfaceUpdate': {'type': 'object', 'description': 'Updates a surface with a new set of components.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The unique identifier for the UI surface.'}, 'components': {'type': 'array', 'description': 'A list of UI components.', 'minItems': 1, 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'id': {'type': 'string', 'description': 'The unique identifier for this component.'}, 'weight': {'type': 'number', 'description': 'Relative weight in Row or Column.'}, 'component': {'type': 'object', 'description': 'Component type and properties.', 'additionalProperties': True}}, 'required': ['id', 'component']}}}, 'required': ['surfaceId', 'components']}, 'dataModelUpdate': {'type': 'object', 'description': 'Updates the data model for a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The surface this data model update applies to.'}, 'path': {'type': 'string', 'description': "Path within the data model (e.g., '/user/name')."}, 'contents': {'type': 'array', 'description': 'Array of data entries.', 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Represents a map as an adjacency list. Can contain nested valueMap for complex structures.', 'items': {'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}}}, 'required': ['key']}}}, 'required': ['contents', 'surfaceId']}, 'deleteSurface': {'type': 'object', 'description': 'Signals the client to delete a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The surface to delete.'}}, 'required': ['surfaceId']}}}}, rule='type')
+    data_is_list = isinstance(data, (list, tuple))
+    if data_is_list:
+        data_len = len(data)
+        for data_x, data_item in enumerate(data):
+            if not isinstance(data_item, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}]".format(**locals()) + " must be object", value=data_item, name="" + (name_prefix or "data") + "[{data_x}]".format(**locals()) + "", definition={'title': 'A2UI Message Schema', 'description': 'Describes a JSON payload for an A2UI (Agent to UI) message.', 'type': 'object', 'additionalProperties': False, 'properties': {'beginRendering': {'type': 'object', 'description': 'Signals the client to begin rendering a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The unique identifier for the UI surface.'}, 'catalogId': {'type': 'string', 'description': 'The identifier of the component catalog to use.'}, 'root': {'type': 'string', 'description': 'The ID of the root component to render.'}, 'styles': {'type': 'object', 'description': 'Styling information for the UI.', 'additionalProperties': True}}, 'required': ['root', 'surfaceId']}, 'surfaceUpdate': {'type': 'object', 'description': 'Updates a surface with a new set of components.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The unique identifier for the UI surface.'}, 'components': {'type': 'array', 'description': 'A list of UI components.', 'minItems': 1, 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'id': {'type': 'string', 'description': 'The unique identifier for this component.'}, 'weight': {'type': 'number', 'description': 'Relative weight in Row or Column.'}, 'component': {'type': 'object', 'description': 'Component type and properties.', 'additionalProperties': True}}, 'required': ['id', 'component']}}}, 'required': ['surfaceId', 'components']}, 'dataModelUpdate': {'type': 'object', 'description': 'Updates the data model for a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The surface this data model update applies to.'}, 'path': {'type': 'string', 'description': "Path within the data model (e.g., '/user/name')."}, 'contents': {'type': 'array', 'description': 'Array of data entries.', 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Represents a map as an adjacency list. Can contain nested valueMap for complex structures.', 'items': {'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}}}, 'required': ['key']}}}, 'required': ['contents', 'surfaceId']}, 'deleteSurface': {'type': 'object', 'description': 'Signals the client to delete a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The surface to delete.'}}, 'required': ['surfaceId']}}}, rule='type')
+            data_item_is_dict = isinstance(data_item, dict)
+            if data_item_is_dict:
+                data_item_keys = set(data_item.keys())
+                if "beginRendering" in data_item_keys:
+                    data_item_keys.remove("beginRendering")
+                    data_item__beginRendering = data_item["beginRendering"]
+                    if not isinstance(data_item__beginRendering, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].beginRendering".format(**locals()) + " must be object", value=data_item__beginRendering, name="" + (name_prefix or "data") + "[{data_x}].beginRendering".format(**locals()) + "", definition={'type': 'object', 'description': 'Signals the client to begin rendering a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The unique identifier for the UI surface.'}, 'catalogId': {'type': 'string', 'description': 'The identifier of the component catalog to use.'}, 'root': {'type': 'string', 'description': 'The ID of the root component to render.'}, 'styles': {'type': 'object', 'description': 'Styling information for the UI.', 'additionalProperties': True}}, 'required': ['root', 'surfaceId']}, rule='type')
+                    data_item__beginRendering_is_dict = isinstance(data_item__beginRendering, dict)
+                    if data_item__beginRendering_is_dict:
+                        data_item__beginRendering__missing_keys = set(['root', 'surfaceId']) - data_item__beginRendering.keys()
+                        if data_item__beginRendering__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].beginRendering".format(**locals()) + " must contain " + (str(sorted(data_item__beginRendering__missing_keys)) + " properties"), value=data_item__beginRendering, name="" + (name_prefix or "data") + "[{data_x}].beginRendering".format(**locals()) + "", definition={'type': 'object', 'description': 'Signals the client to begin rendering a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The unique identifier for the UI surface.'}, 'catalogId': {'type': 'string', 'description': 'The identifier of the component catalog to use.'}, 'root': {'type': 'string', 'description': 'The ID of the root component to render.'}, 'styles': {'type': 'object', 'description': 'Styling information for the UI.', 'additionalProperties': True}}, 'required': ['root', 'surfaceId']}, rule='required')
+                        data_item__beginRendering_keys = set(data_item__beginRendering.keys())
+                        if "surfaceId" in data_item__beginRendering_keys:
+                            data_item__beginRendering_keys.remove("surfaceId")
+                            data_item__beginRendering__surfaceId = data_item__beginRendering["surfaceId"]
+                            if not isinstance(data_item__beginRendering__surfaceId, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].beginRendering.surfaceId".format(**locals()) + " must be string", value=data_item__beginRendering__surfaceId, name="" + (name_prefix or "data") + "[{data_x}].beginRendering.surfaceId".format(**locals()) + "", definition={'type': 'string', 'description': 'The unique identifier for the UI surface.'}, rule='type')
+                        if "catalogId" in data_item__beginRendering_keys:
+                            data_item__beginRendering_keys.remove("catalogId")
+                            data_item__beginRendering__catalogId = data_item__beginRendering["catalogId"]
+                            if not isinstance(data_item__beginRendering__catalogId, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].beginRendering.catalogId".format(**locals()) + " must be string", value=data_item__beginRendering__catalogId, name="" + (name_prefix or "data") + "[{data_x}].beginRendering.catalogId".format(**locals()) + "", definition={'type': 'string', 'description': 'The identifier of the component catalog to use.'}, rule='type')
+                        if "root" in data_item__beginRendering_keys:
+                            data_item__beginRendering_keys.remove("root")
+                            data_item__beginRendering__root = data_item__beginRendering["root"]
+                            if not isinstance(data_item__beginRendering__root, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].beginRendering.root".format(**locals()) + " must be string", value=data_item__beginRendering__root, name="" + (name_prefix or "data") + "[{data_x}].beginRendering.root".format(**locals()) + "", definition={'type': 'string', 'description': 'The ID of the root component to render.'}, rule='type')
+                        if "styles" in data_item__beginRendering_keys:
+                            data_item__beginRendering_keys.remove("styles")
+                            data_item__beginRendering__styles = data_item__beginRendering["styles"]
+                            if not isinstance(data_item__beginRendering__styles, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].beginRendering.styles".format(**locals()) + " must be object", value=data_item__beginRendering__styles, name="" + (name_prefix or "data") + "[{data_x}].beginRendering.styles".format(**locals()) + "", definition={'type': 'object', 'description': 'Styling information for the UI.', 'additionalProperties': True}, rule='type')
+                            data_item__beginRendering__styles_is_dict = isinstance(data_item__beginRendering__styles, dict)
+                            if data_item__beginRendering__styles_is_dict:
+                                data_item__beginRendering__styles_keys = set(data_item__beginRendering__styles.keys())
+                        if data_item__beginRendering_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].beginRendering".format(**locals()) + " must not contain "+str(data_item__beginRendering_keys)+" properties", value=data_item__beginRendering, name="" + (name_prefix or "data") + "[{data_x}].beginRendering".format(**locals()) + "", definition={'type': 'object', 'description': 'Signals the client to begin rendering a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The unique identifier for the UI surface.'}, 'catalogId': {'type': 'string', 'description': 'The identifier of the component catalog to use.'}, 'root': {'type': 'string', 'description': 'The ID of the root component to render.'}, 'styles': {'type': 'object', 'description': 'Styling information for the UI.', 'additionalProperties': True}}, 'required': ['root', 'surfaceId']}, rule='additionalProperties')
+                if "surfaceUpdate" in data_item_keys:
+                    data_item_keys.remove("surfaceUpdate")
+                    data_item__surfaceUpdate = data_item["surfaceUpdate"]
+                    if not isinstance(data_item__surfaceUpdate, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].surfaceUpdate".format(**locals()) + " must be object", value=data_item__surfaceUpdate, name="" + (name_prefix or "data") + "[{data_x}].surfaceUpdate".format(**locals()) + "", definition={'type': 'object', 'description': 'Updates a surface with a new set of components.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The unique identifier for the UI surface.'}, 'components': {'type': 'array', 'description': 'A list of UI components.', 'minItems': 1, 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'id': {'type': 'string', 'description': 'The unique identifier for this component.'}, 'weight': {'type': 'number', 'description': 'Relative weight in Row or Column.'}, 'component': {'type': 'object', 'description': 'Component type and properties.', 'additionalProperties': True}}, 'required': ['id', 'component']}}}, 'required': ['surfaceId', 'components']}, rule='type')
+                    data_item__surfaceUpdate_is_dict = isinstance(data_item__surfaceUpdate, dict)
+                    if data_item__surfaceUpdate_is_dict:
+                        data_item__surfaceUpdate__missing_keys = set(['surfaceId', 'components']) - data_item__surfaceUpdate.keys()
+                        if data_item__surfaceUpdate__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].surfaceUpdate".format(**locals()) + " must contain " + (str(sorted(data_item__surfaceUpdate__missing_keys)) + " properties"), value=data_item__surfaceUpdate, name="" + (name_prefix or "data") + "[{data_x}].surfaceUpdate".format(**locals()) + "", definition={'type': 'object', 'description': 'Updates a surface with a new set of components.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The unique identifier for the UI surface.'}, 'components': {'type': 'array', 'description': 'A list of UI components.', 'minItems': 1, 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'id': {'type': 'string', 'description': 'The unique identifier for this component.'}, 'weight': {'type': 'number', 'description': 'Relative weight in Row or Column.'}, 'component': {'type': 'object', 'description': 'Component type and properties.', 'additionalProperties': True}}, 'required': ['id', 'component']}}}, 'required': ['surfaceId', 'components']}, rule='required')
+                        data_item__surfaceUpdate_keys = set(data_item__surfaceUpdate.keys())
+                        if "surfaceId" in data_item__surfaceUpdate_keys:
+                            data_item__surfaceUpdate_keys.remove("surfaceId")
+                            data_item__surfaceUpdate__surfaceId = data_item__surfaceUpdate["surfaceId"]
+                            if not isinstance(data_item__surfaceUpdate__surfaceId, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.surfaceId".format(**locals()) + " must be string", value=data_item__surfaceUpdate__surfaceId, name="" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.surfaceId".format(**locals()) + "", definition={'type': 'string', 'description': 'The unique identifier for the UI surface.'}, rule='type')
+                        if "components" in data_item__surfaceUpdate_keys:
+                            data_item__surfaceUpdate_keys.remove("components")
+                            data_item__surfaceUpdate__components = data_item__surfaceUpdate["components"]
+                            if not isinstance(data_item__surfaceUpdate__components, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components".format(**locals()) + " must be array", value=data_item__surfaceUpdate__components, name="" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components".format(**locals()) + "", definition={'type': 'array', 'description': 'A list of UI components.', 'minItems': 1, 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'id': {'type': 'string', 'description': 'The unique identifier for this component.'}, 'weight': {'type': 'number', 'description': 'Relative weight in Row or Column.'}, 'component': {'type': 'object', 'description': 'Component type and properties.', 'additionalProperties': True}}, 'required': ['id', 'component']}}, rule='type')
+                            data_item__surfaceUpdate__components_is_list = isinstance(data_item__surfaceUpdate__components, (list, tuple))
+                            if data_item__surfaceUpdate__components_is_list:
+                                data_item__surfaceUpdate__components_len = len(data_item__surfaceUpdate__components)
+                                if data_item__surfaceUpdate__components_len < 1:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components".format(**locals()) + " must contain at least 1 items", value=data_item__surfaceUpdate__components, name="" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components".format(**locals()) + "", definition={'type': 'array', 'description': 'A list of UI components.', 'minItems': 1, 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'id': {'type': 'string', 'description': 'The unique identifier for this component.'}, 'weight': {'type': 'number', 'description': 'Relative weight in Row or Column.'}, 'component': {'type': 'object', 'description': 'Component type and properties.', 'additionalProperties': True}}, 'required': ['id', 'component']}}, rule='minItems')
+                                for data_item__surfaceUpdate__components_x, data_item__surfaceUpdate__components_item in enumerate(data_item__surfaceUpdate__components):
+                                    if not isinstance(data_item__surfaceUpdate__components_item, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components[{data_item__surfaceUpdate__components_x}]".format(**locals()) + " must be object", value=data_item__surfaceUpdate__components_item, name="" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components[{data_item__surfaceUpdate__components_x}]".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': False, 'properties': {'id': {'type': 'string', 'description': 'The unique identifier for this component.'}, 'weight': {'type': 'number', 'description': 'Relative weight in Row or Column.'}, 'component': {'type': 'object', 'description': 'Component type and properties.', 'additionalProperties': True}}, 'required': ['id', 'component']}, rule='type')
+                                    data_item__surfaceUpdate__components_item_is_dict = isinstance(data_item__surfaceUpdate__components_item, dict)
+                                    if data_item__surfaceUpdate__components_item_is_dict:
+                                        data_item__surfaceUpdate__components_item__missing_keys = set(['id', 'component']) - data_item__surfaceUpdate__components_item.keys()
+                                        if data_item__surfaceUpdate__components_item__missing_keys:
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components[{data_item__surfaceUpdate__components_x}]".format(**locals()) + " must contain " + (str(sorted(data_item__surfaceUpdate__components_item__missing_keys)) + " properties"), value=data_item__surfaceUpdate__components_item, name="" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components[{data_item__surfaceUpdate__components_x}]".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': False, 'properties': {'id': {'type': 'string', 'description': 'The unique identifier for this component.'}, 'weight': {'type': 'number', 'description': 'Relative weight in Row or Column.'}, 'component': {'type': 'object', 'description': 'Component type and properties.', 'additionalProperties': True}}, 'required': ['id', 'component']}, rule='required')
+                                        data_item__surfaceUpdate__components_item_keys = set(data_item__surfaceUpdate__components_item.keys())
+                                        if "id" in data_item__surfaceUpdate__components_item_keys:
+                                            data_item__surfaceUpdate__components_item_keys.remove("id")
+                                            data_item__surfaceUpdate__components_item__id = data_item__surfaceUpdate__components_item["id"]
+                                            if not isinstance(data_item__surfaceUpdate__components_item__id, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components[{data_item__surfaceUpdate__components_x}].id".format(**locals()) + " must be string", value=data_item__surfaceUpdate__components_item__id, name="" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components[{data_item__surfaceUpdate__components_x}].id".format(**locals()) + "", definition={'type': 'string', 'description': 'The unique identifier for this component.'}, rule='type')
+                                        if "weight" in data_item__surfaceUpdate__components_item_keys:
+                                            data_item__surfaceUpdate__components_item_keys.remove("weight")
+                                            data_item__surfaceUpdate__components_item__weight = data_item__surfaceUpdate__components_item["weight"]
+                                            if not isinstance(data_item__surfaceUpdate__components_item__weight, (int, float, Decimal)) or isinstance(data_item__surfaceUpdate__components_item__weight, bool):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components[{data_item__surfaceUpdate__components_x}].weight".format(**locals()) + " must be number", value=data_item__surfaceUpdate__components_item__weight, name="" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components[{data_item__surfaceUpdate__components_x}].weight".format(**locals()) + "", definition={'type': 'number', 'description': 'Relative weight in Row or Column.'}, rule='type')
+                                        if "component" in data_item__surfaceUpdate__components_item_keys:
+                                            data_item__surfaceUpdate__components_item_keys.remove("component")
+                                            data_item__surfaceUpdate__components_item__component = data_item__surfaceUpdate__components_item["component"]
+                                            if not isinstance(data_item__surfaceUpdate__components_item__component, (dict)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components[{data_item__surfaceUpdate__components_x}].component".format(**locals()) + " must be object", value=data_item__surfaceUpdate__components_item__component, name="" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components[{data_item__surfaceUpdate__components_x}].component".format(**locals()) + "", definition={'type': 'object', 'description': 'Component type and properties.', 'additionalProperties': True}, rule='type')
+                                            data_item__surfaceUpdate__components_item__component_is_dict = isinstance(data_item__surfaceUpdate__components_item__component, dict)
+                                            if data_item__surfaceUpdate__components_item__component_is_dict:
+                                                data_item__surfaceUpdate__components_item__component_keys = set(data_item__surfaceUpdate__components_item__component.keys())
+                                        if data_item__surfaceUpdate__components_item_keys:
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components[{data_item__surfaceUpdate__components_x}]".format(**locals()) + " must not contain "+str(data_item__surfaceUpdate__components_item_keys)+" properties", value=data_item__surfaceUpdate__components_item, name="" + (name_prefix or "data") + "[{data_x}].surfaceUpdate.components[{data_item__surfaceUpdate__components_x}]".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': False, 'properties': {'id': {'type': 'string', 'description': 'The unique identifier for this component.'}, 'weight': {'type': 'number', 'description': 'Relative weight in Row or Column.'}, 'component': {'type': 'object', 'description': 'Component type and properties.', 'additionalProperties': True}}, 'required': ['id', 'component']}, rule='additionalProperties')
+                        if data_item__surfaceUpdate_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].surfaceUpdate".format(**locals()) + " must not contain "+str(data_item__surfaceUpdate_keys)+" properties", value=data_item__surfaceUpdate, name="" + (name_prefix or "data") + "[{data_x}].surfaceUpdate".format(**locals()) + "", definition={'type': 'object', 'description': 'Updates a surface with a new set of components.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The unique identifier for the UI surface.'}, 'components': {'type': 'array', 'description': 'A list of UI components.', 'minItems': 1, 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'id': {'type': 'string', 'description': 'The unique identifier for this component.'}, 'weight': {'type': 'number', 'description': 'Relative weight in Row or Column.'}, 'component': {'type': 'object', 'description': 'Component type and properties.', 'additionalProperties': True}}, 'required': ['id', 'component']}}}, 'required': ['surfaceId', 'components']}, rule='additionalProperties')
+                if "dataModelUpdate" in data_item_keys:
+                    data_item_keys.remove("dataModelUpdate")
+                    data_item__dataModelUpdate = data_item["dataModelUpdate"]
+                    if not isinstance(data_item__dataModelUpdate, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate".format(**locals()) + " must be object", value=data_item__dataModelUpdate, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate".format(**locals()) + "", definition={'type': 'object', 'description': 'Updates the data model for a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The surface this data model update applies to.'}, 'path': {'type': 'string', 'description': "Path within the data model (e.g., '/user/name')."}, 'contents': {'type': 'array', 'description': 'Array of data entries.', 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Represents a map as an adjacency list. Can contain nested valueMap for complex structures.', 'items': {'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}}}, 'required': ['key']}}}, 'required': ['contents', 'surfaceId']}, rule='type')
+                    data_item__dataModelUpdate_is_dict = isinstance(data_item__dataModelUpdate, dict)
+                    if data_item__dataModelUpdate_is_dict:
+                        data_item__dataModelUpdate__missing_keys = set(['contents', 'surfaceId']) - data_item__dataModelUpdate.keys()
+                        if data_item__dataModelUpdate__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate".format(**locals()) + " must contain " + (str(sorted(data_item__dataModelUpdate__missing_keys)) + " properties"), value=data_item__dataModelUpdate, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate".format(**locals()) + "", definition={'type': 'object', 'description': 'Updates the data model for a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The surface this data model update applies to.'}, 'path': {'type': 'string', 'description': "Path within the data model (e.g., '/user/name')."}, 'contents': {'type': 'array', 'description': 'Array of data entries.', 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Represents a map as an adjacency list. Can contain nested valueMap for complex structures.', 'items': {'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}}}, 'required': ['key']}}}, 'required': ['contents', 'surfaceId']}, rule='required')
+                        data_item__dataModelUpdate_keys = set(data_item__dataModelUpdate.keys())
+                        if "surfaceId" in data_item__dataModelUpdate_keys:
+                            data_item__dataModelUpdate_keys.remove("surfaceId")
+                            data_item__dataModelUpdate__surfaceId = data_item__dataModelUpdate["surfaceId"]
+                            if not isinstance(data_item__dataModelUpdate__surfaceId, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.surfaceId".format(**locals()) + " must be string", value=data_item__dataModelUpdate__surfaceId, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.surfaceId".format(**locals()) + "", definition={'type': 'string', 'description': 'The surface this data model update applies to.'}, rule='type')
+                        if "path" in data_item__dataModelUpdate_keys:
+                            data_item__dataModelUpdate_keys.remove("path")
+                            data_item__dataModelUpdate__path = data_item__dataModelUpdate["path"]
+                            if not isinstance(data_item__dataModelUpdate__path, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.path".format(**locals()) + " must be string", value=data_item__dataModelUpdate__path, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.path".format(**locals()) + "", definition={'type': 'string', 'description': "Path within the data model (e.g., '/user/name')."}, rule='type')
+                        if "contents" in data_item__dataModelUpdate_keys:
+                            data_item__dataModelUpdate_keys.remove("contents")
+                            data_item__dataModelUpdate__contents = data_item__dataModelUpdate["contents"]
+                            if not isinstance(data_item__dataModelUpdate__contents, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents".format(**locals()) + " must be array", value=data_item__dataModelUpdate__contents, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents".format(**locals()) + "", definition={'type': 'array', 'description': 'Array of data entries.', 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Represents a map as an adjacency list. Can contain nested valueMap for complex structures.', 'items': {'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}}}, 'required': ['key']}}, rule='type')
+                            data_item__dataModelUpdate__contents_is_list = isinstance(data_item__dataModelUpdate__contents, (list, tuple))
+                            if data_item__dataModelUpdate__contents_is_list:
+                                data_item__dataModelUpdate__contents_len = len(data_item__dataModelUpdate__contents)
+                                for data_item__dataModelUpdate__contents_x, data_item__dataModelUpdate__contents_item in enumerate(data_item__dataModelUpdate__contents):
+                                    if not isinstance(data_item__dataModelUpdate__contents_item, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}]".format(**locals()) + " must be object", value=data_item__dataModelUpdate__contents_item, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}]".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': False, 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Represents a map as an adjacency list. Can contain nested valueMap for complex structures.', 'items': {'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}}}, 'required': ['key']}, rule='type')
+                                    data_item__dataModelUpdate__contents_item_is_dict = isinstance(data_item__dataModelUpdate__contents_item, dict)
+                                    if data_item__dataModelUpdate__contents_item_is_dict:
+                                        data_item__dataModelUpdate__contents_item__missing_keys = set(['key']) - data_item__dataModelUpdate__contents_item.keys()
+                                        if data_item__dataModelUpdate__contents_item__missing_keys:
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}]".format(**locals()) + " must contain " + (str(sorted(data_item__dataModelUpdate__contents_item__missing_keys)) + " properties"), value=data_item__dataModelUpdate__contents_item, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}]".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': False, 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Represents a map as an adjacency list. Can contain nested valueMap for complex structures.', 'items': {'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}}}, 'required': ['key']}, rule='required')
+                                        data_item__dataModelUpdate__contents_item_keys = set(data_item__dataModelUpdate__contents_item.keys())
+                                        if "key" in data_item__dataModelUpdate__contents_item_keys:
+                                            data_item__dataModelUpdate__contents_item_keys.remove("key")
+                                            data_item__dataModelUpdate__contents_item__key = data_item__dataModelUpdate__contents_item["key"]
+                                            if not isinstance(data_item__dataModelUpdate__contents_item__key, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].key".format(**locals()) + " must be string", value=data_item__dataModelUpdate__contents_item__key, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].key".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                        if "valueString" in data_item__dataModelUpdate__contents_item_keys:
+                                            data_item__dataModelUpdate__contents_item_keys.remove("valueString")
+                                            data_item__dataModelUpdate__contents_item__valueString = data_item__dataModelUpdate__contents_item["valueString"]
+                                            if not isinstance(data_item__dataModelUpdate__contents_item__valueString, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueString".format(**locals()) + " must be string", value=data_item__dataModelUpdate__contents_item__valueString, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueString".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                        if "valueNumber" in data_item__dataModelUpdate__contents_item_keys:
+                                            data_item__dataModelUpdate__contents_item_keys.remove("valueNumber")
+                                            data_item__dataModelUpdate__contents_item__valueNumber = data_item__dataModelUpdate__contents_item["valueNumber"]
+                                            if not isinstance(data_item__dataModelUpdate__contents_item__valueNumber, (int, float, Decimal)) or isinstance(data_item__dataModelUpdate__contents_item__valueNumber, bool):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueNumber".format(**locals()) + " must be number", value=data_item__dataModelUpdate__contents_item__valueNumber, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueNumber".format(**locals()) + "", definition={'type': 'number'}, rule='type')
+                                        if "valueBoolean" in data_item__dataModelUpdate__contents_item_keys:
+                                            data_item__dataModelUpdate__contents_item_keys.remove("valueBoolean")
+                                            data_item__dataModelUpdate__contents_item__valueBoolean = data_item__dataModelUpdate__contents_item["valueBoolean"]
+                                            if not isinstance(data_item__dataModelUpdate__contents_item__valueBoolean, (bool)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueBoolean".format(**locals()) + " must be boolean", value=data_item__dataModelUpdate__contents_item__valueBoolean, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueBoolean".format(**locals()) + "", definition={'type': 'boolean'}, rule='type')
+                                        if "valueMap" in data_item__dataModelUpdate__contents_item_keys:
+                                            data_item__dataModelUpdate__contents_item_keys.remove("valueMap")
+                                            data_item__dataModelUpdate__contents_item__valueMap = data_item__dataModelUpdate__contents_item["valueMap"]
+                                            if not isinstance(data_item__dataModelUpdate__contents_item__valueMap, (list, tuple)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap".format(**locals()) + " must be array", value=data_item__dataModelUpdate__contents_item__valueMap, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap".format(**locals()) + "", definition={'type': 'array', 'description': 'Represents a map as an adjacency list. Can contain nested valueMap for complex structures.', 'items': {'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}}, rule='type')
+                                            data_item__dataModelUpdate__contents_item__valueMap_is_list = isinstance(data_item__dataModelUpdate__contents_item__valueMap, (list, tuple))
+                                            if data_item__dataModelUpdate__contents_item__valueMap_is_list:
+                                                data_item__dataModelUpdate__contents_item__valueMap_len = len(data_item__dataModelUpdate__contents_item__valueMap)
+                                                for data_item__dataModelUpdate__contents_item__valueMap_x, data_item__dataModelUpdate__contents_item__valueMap_item in enumerate(data_item__dataModelUpdate__contents_item__valueMap):
+                                                    if not isinstance(data_item__dataModelUpdate__contents_item__valueMap_item, (dict)):
+                                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}]".format(**locals()) + " must be object", value=data_item__dataModelUpdate__contents_item__valueMap_item, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}]".format(**locals()) + "", definition={'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}, rule='type')
+                                                    data_item__dataModelUpdate__contents_item__valueMap_item_is_dict = isinstance(data_item__dataModelUpdate__contents_item__valueMap_item, dict)
+                                                    if data_item__dataModelUpdate__contents_item__valueMap_item_is_dict:
+                                                        data_item__dataModelUpdate__contents_item__valueMap_item__missing_keys = set(['key']) - data_item__dataModelUpdate__contents_item__valueMap_item.keys()
+                                                        if data_item__dataModelUpdate__contents_item__valueMap_item__missing_keys:
+                                                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}]".format(**locals()) + " must contain " + (str(sorted(data_item__dataModelUpdate__contents_item__valueMap_item__missing_keys)) + " properties"), value=data_item__dataModelUpdate__contents_item__valueMap_item, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}]".format(**locals()) + "", definition={'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}, rule='required')
+                                                        data_item__dataModelUpdate__contents_item__valueMap_item_keys = set(data_item__dataModelUpdate__contents_item__valueMap_item.keys())
+                                                        if "key" in data_item__dataModelUpdate__contents_item__valueMap_item_keys:
+                                                            data_item__dataModelUpdate__contents_item__valueMap_item_keys.remove("key")
+                                                            data_item__dataModelUpdate__contents_item__valueMap_item__key = data_item__dataModelUpdate__contents_item__valueMap_item["key"]
+                                                            if not isinstance(data_item__dataModelUpdate__contents_item__valueMap_item__key, (str)):
+                                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}].key".format(**locals()) + " must be string", value=data_item__dataModelUpdate__contents_item__valueMap_item__key, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}].key".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                                        if "valueString" in data_item__dataModelUpdate__contents_item__valueMap_item_keys:
+                                                            data_item__dataModelUpdate__contents_item__valueMap_item_keys.remove("valueString")
+                                                            data_item__dataModelUpdate__contents_item__valueMap_item__valueString = data_item__dataModelUpdate__contents_item__valueMap_item["valueString"]
+                                                            if not isinstance(data_item__dataModelUpdate__contents_item__valueMap_item__valueString, (str)):
+                                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}].valueString".format(**locals()) + " must be string", value=data_item__dataModelUpdate__contents_item__valueMap_item__valueString, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}].valueString".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                                        if "valueNumber" in data_item__dataModelUpdate__contents_item__valueMap_item_keys:
+                                                            data_item__dataModelUpdate__contents_item__valueMap_item_keys.remove("valueNumber")
+                                                            data_item__dataModelUpdate__contents_item__valueMap_item__valueNumber = data_item__dataModelUpdate__contents_item__valueMap_item["valueNumber"]
+                                                            if not isinstance(data_item__dataModelUpdate__contents_item__valueMap_item__valueNumber, (int, float, Decimal)) or isinstance(data_item__dataModelUpdate__contents_item__valueMap_item__valueNumber, bool):
+                                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}].valueNumber".format(**locals()) + " must be number", value=data_item__dataModelUpdate__contents_item__valueMap_item__valueNumber, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}].valueNumber".format(**locals()) + "", definition={'type': 'number'}, rule='type')
+                                                        if "valueBoolean" in data_item__dataModelUpdate__contents_item__valueMap_item_keys:
+                                                            data_item__dataModelUpdate__contents_item__valueMap_item_keys.remove("valueBoolean")
+                                                            data_item__dataModelUpdate__contents_item__valueMap_item__valueBoolean = data_item__dataModelUpdate__contents_item__valueMap_item["valueBoolean"]
+                                                            if not isinstance(data_item__dataModelUpdate__contents_item__valueMap_item__valueBoolean, (bool)):
+                                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}].valueBoolean".format(**locals()) + " must be boolean", value=data_item__dataModelUpdate__contents_item__valueMap_item__valueBoolean, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}].valueBoolean".format(**locals()) + "", definition={'type': 'boolean'}, rule='type')
+                                                        if "valueMap" in data_item__dataModelUpdate__contents_item__valueMap_item_keys:
+                                                            data_item__dataModelUpdate__contents_item__valueMap_item_keys.remove("valueMap")
+                                                            data_item__dataModelUpdate__contents_item__valueMap_item__valueMap = data_item__dataModelUpdate__contents_item__valueMap_item["valueMap"]
+                                                            if not isinstance(data_item__dataModelUpdate__contents_item__valueMap_item__valueMap, (list, tuple)):
+                                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}].valueMap".format(**locals()) + " must be array", value=data_item__dataModelUpdate__contents_item__valueMap_item__valueMap, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}].valueMap[{data_item__dataModelUpdate__contents_item__valueMap_x}].valueMap".format(**locals()) + "", definition={'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}, rule='type')
+                                        if data_item__dataModelUpdate__contents_item_keys:
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}]".format(**locals()) + " must not contain "+str(data_item__dataModelUpdate__contents_item_keys)+" properties", value=data_item__dataModelUpdate__contents_item, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate.contents[{data_item__dataModelUpdate__contents_x}]".format(**locals()) + "", definition={'type': 'object', 'additionalProperties': False, 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Represents a map as an adjacency list. Can contain nested valueMap for complex structures.', 'items': {'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}}}, 'required': ['key']}, rule='additionalProperties')
+                        if data_item__dataModelUpdate_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].dataModelUpdate".format(**locals()) + " must not contain "+str(data_item__dataModelUpdate_keys)+" properties", value=data_item__dataModelUpdate, name="" + (name_prefix or "data") + "[{data_x}].dataModelUpdate".format(**locals()) + "", definition={'type': 'object', 'description': 'Updates the data model for a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The surface this data model update applies to.'}, 'path': {'type': 'string', 'description': "Path within the data model (e.g., '/user/name')."}, 'contents': {'type': 'array', 'description': 'Array of data entries.', 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Represents a map as an adjacency list. Can contain nested valueMap for complex structures.', 'items': {'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}}}, 'required': ['key']}}}, 'required': ['contents', 'surfaceId']}, rule='additionalProperties')
+                if "deleteSurface" in data_item_keys:
+                    data_item_keys.remove("deleteSurface")
+                    data_item__deleteSurface = data_item["deleteSurface"]
+                    if not isinstance(data_item__deleteSurface, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].deleteSurface".format(**locals()) + " must be object", value=data_item__deleteSurface, name="" + (name_prefix or "data") + "[{data_x}].deleteSurface".format(**locals()) + "", definition={'type': 'object', 'description': 'Signals the client to delete a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The surface to delete.'}}, 'required': ['surfaceId']}, rule='type')
+                    data_item__deleteSurface_is_dict = isinstance(data_item__deleteSurface, dict)
+                    if data_item__deleteSurface_is_dict:
+                        data_item__deleteSurface__missing_keys = set(['surfaceId']) - data_item__deleteSurface.keys()
+                        if data_item__deleteSurface__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].deleteSurface".format(**locals()) + " must contain " + (str(sorted(data_item__deleteSurface__missing_keys)) + " properties"), value=data_item__deleteSurface, name="" + (name_prefix or "data") + "[{data_x}].deleteSurface".format(**locals()) + "", definition={'type': 'object', 'description': 'Signals the client to delete a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The surface to delete.'}}, 'required': ['surfaceId']}, rule='required')
+                        data_item__deleteSurface_keys = set(data_item__deleteSurface.keys())
+                        if "surfaceId" in data_item__deleteSurface_keys:
+                            data_item__deleteSurface_keys.remove("surfaceId")
+                            data_item__deleteSurface__surfaceId = data_item__deleteSurface["surfaceId"]
+                            if not isinstance(data_item__deleteSurface__surfaceId, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].deleteSurface.surfaceId".format(**locals()) + " must be string", value=data_item__deleteSurface__surfaceId, name="" + (name_prefix or "data") + "[{data_x}].deleteSurface.surfaceId".format(**locals()) + "", definition={'type': 'string', 'description': 'The surface to delete.'}, rule='type')
+                        if data_item__deleteSurface_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}].deleteSurface".format(**locals()) + " must not contain "+str(data_item__deleteSurface_keys)+" properties", value=data_item__deleteSurface, name="" + (name_prefix or "data") + "[{data_x}].deleteSurface".format(**locals()) + "", definition={'type': 'object', 'description': 'Signals the client to delete a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The surface to delete.'}}, 'required': ['surfaceId']}, rule='additionalProperties')
+                if data_item_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + "[{data_x}]".format(**locals()) + " must not contain "+str(data_item_keys)+" properties", value=data_item, name="" + (name_prefix or "data") + "[{data_x}]".format(**locals()) + "", definition={'title': 'A2UI Message Schema', 'description': 'Describes a JSON payload for an A2UI (Agent to UI) message.', 'type': 'object', 'additionalProperties': False, 'properties': {'beginRendering': {'type': 'object', 'description': 'Signals the client to begin rendering a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The unique identifier for the UI surface.'}, 'catalogId': {'type': 'string', 'description': 'The identifier of the component catalog to use.'}, 'root': {'type': 'string', 'description': 'The ID of the root component to render.'}, 'styles': {'type': 'object', 'description': 'Styling information for the UI.', 'additionalProperties': True}}, 'required': ['root', 'surfaceId']}, 'surfaceUpdate': {'type': 'object', 'description': 'Updates a surface with a new set of components.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The unique identifier for the UI surface.'}, 'components': {'type': 'array', 'description': 'A list of UI components.', 'minItems': 1, 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'id': {'type': 'string', 'description': 'The unique identifier for this component.'}, 'weight': {'type': 'number', 'description': 'Relative weight in Row or Column.'}, 'component': {'type': 'object', 'description': 'Component type and properties.', 'additionalProperties': True}}, 'required': ['id', 'component']}}}, 'required': ['surfaceId', 'components']}, 'dataModelUpdate': {'type': 'object', 'description': 'Updates the data model for a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The surface this data model update applies to.'}, 'path': {'type': 'string', 'description': "Path within the data model (e.g., '/user/name')."}, 'contents': {'type': 'array', 'description': 'Array of data entries.', 'items': {'type': 'object', 'additionalProperties': False, 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Represents a map as an adjacency list. Can contain nested valueMap for complex structures.', 'items': {'type': 'object', 'description': "One entry in the map. Exactly one 'value*' property should be provided alongside the key.", 'properties': {'key': {'type': 'string'}, 'valueString': {'type': 'string'}, 'valueNumber': {'type': 'number'}, 'valueBoolean': {'type': 'boolean'}, 'valueMap': {'type': 'array', 'description': 'Nested map for complex data structures like lists of objects.'}}, 'required': ['key']}}}, 'required': ['key']}}}, 'required': ['contents', 'surfaceId']}, 'deleteSurface': {'type': 'object', 'description': 'Signals the client to delete a surface.', 'additionalProperties': False, 'properties': {'surfaceId': {'type': 'string', 'description': 'The surface to delete.'}}, 'required': ['surfaceId']}}}, rule='additionalProperties')
+    return data
\ No newline at end of file
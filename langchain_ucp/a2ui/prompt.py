@@ -14,32 +14,68 @@ Usage:
     ... )
 """
 
+import functools
 import json
 import logging
+import re
 from typing import Any
 
-from langchain_ucp.a2ui.schema import A2UI_MESSAGE_SCHEMA, wrap_as_json_array
+from langchain_ucp.a2ui.schema import (
+    A2UI_ARRAY_VALIDATOR,
+    A2UI_MESSAGE_ARRAY_SCHEMA,
+    _A2UI_ARRAY_FAST_VALIDATOR,
+)
+from langchain_ucp.a2ui.templates import (
+    create_checkout_ui,
+    create_order_confirmation,
+    create_product_card,
+    create_product_list,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 logger = logging.getLogger(__name__)
 
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        """Serialize to indented JSON using orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> str:
+        """Serialize to indented JSON using the standard library."""
+        return json.dumps(obj, indent=2)
+
+
 # The delimiter used to separate text content from A2UI JSON in responses
 A2UI_DELIMITER = "---a2ui_JSON---"
 
+# Matches a leading ```/```json fence and a trailing ``` fence
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
 
-def _get_commerce_examples() -> str:
+# The schema never changes at runtime, so serialize it once at import time
+_A2UI_SCHEMA_JSON = _dumps(A2UI_MESSAGE_ARRAY_SCHEMA)
+
+
+def _build_commerce_examples() -> str:
     """Generate commerce UI examples using templates.
     
     Uses the helper functions from templates.py to generate consistent examples.
     These are FORMAT TEMPLATES only - actual data must come from tool calls.
     """
-    # Import here to avoid circular imports
-    from langchain_ucp.a2ui.templates import (
-        create_product_card,
-        create_product_list,
-        create_checkout_ui,
-        create_order_confirmation,
-    )
-    
     examples = []
     
     # Add critical warning at the top
@@ -65,7 +101,7 @@ You MUST:
 Format template for a single product card. Replace {{{{...}}}} placeholders with REAL data from search_shopping_catalog tool:
 
 {A2UI_DELIMITER}
-{json.dumps(product_card, indent=2)}
+{_dumps(product_card)}
 """)
     
     # Product List Example - use obvious placeholder values
@@ -84,7 +120,7 @@ Format template for product list. Replace {{{{...}}}} placeholders with REAL dat
 Include ALL products returned by the tool, not just 2-3:
 
 {A2UI_DELIMITER}
-{json.dumps(product_list, indent=2)}
+{_dumps(product_list)}
 """)
     
     # Checkout Example - use placeholder values for cart, EMPTY for address
@@ -116,7 +152,7 @@ WORKFLOW:
 - ⚠️ CHECKOUT CANNOT BE COMPLETED WITHOUT SHIPPING ADDRESS - ask user to provide it first!
 
 {A2UI_DELIMITER}
-{json.dumps(checkout, indent=2)}
+{_dumps(checkout)}
 """)
     
     # Order Confirmation Example - use placeholder values
@@ -135,12 +171,22 @@ Format template for order confirmation after successful purchase.
 - NEVER use example addresses like "123 Main St"
 
 {A2UI_DELIMITER}
-{json.dumps(confirmation, indent=2)}
+{_dumps(confirmation)}
 """)
     
     return "\nCOMMERCE UI EXAMPLES:\n" + "\n".join(examples)
 
 
+# The examples only use placeholder data, so build them once at import time
+_COMMERCE_EXAMPLES = _build_commerce_examples()
+
+
+def _get_commerce_examples() -> str:
+    """Get the prebuilt commerce UI examples."""
+    return _COMMERCE_EXAMPLES
+
+
+@functools.lru_cache(maxsize=4)
 def get_a2ui_system_prompt(
     include_schema: bool = True,
     include_commerce_examples: bool = True,
@@ -155,8 +201,13 @@ def get_a2ui_system_prompt(
         include_schema: Whether to include the full A2UI schema.
         include_commerce_examples: Whether to include commerce-specific examples.
 
+    The output contains no per-call data (timestamps, IDs), so it is
+    byte-identical across calls and can be used as a cacheable static
+    prefix. Append any dynamic context after it, not before.
+
     Returns:
-        System prompt string with A2UI instructions.
+        System prompt string with A2UI instructions. The result is cached
+        per flag combination, so repeated calls return the same string.
     """
     prompt_parts = [
         f"""
@@ -214,7 +265,7 @@ Here are the flowers you requested!
     if include_schema:
         prompt_parts.append(f"""
 ---BEGIN A2UI JSON SCHEMA---
-{json.dumps(wrap_as_json_array(A2UI_MESSAGE_SCHEMA), indent=2)}
+{_A2UI_SCHEMA_JSON}
 ---END A2UI JSON SCHEMA---
 """)
 
@@ -231,17 +282,12 @@ def validate_a2ui_json(json_string: str, schema: dict[str, Any] | None = None) -
     Returns:
         Tuple of (is_valid, parsed_data, error_message).
     """
-    if schema is None:
-        schema = wrap_as_json_array(A2UI_MESSAGE_SCHEMA)
-
     try:
         # Clean the JSON string (remove markdown code blocks if present)
-        cleaned = json_string.strip()
-        if cleaned.startswith("```"):
-            cleaned = cleaned.lstrip("```json").lstrip("```").rstrip("```").strip()
+        cleaned = _FENCE_RE.sub("", json_string).strip()
 
         # Parse JSON
-        parsed = json.loads(cleaned)
+        parsed = _loads(cleaned)
 
         # Auto-wrap single object in list
         if isinstance(parsed, dict):
@@ -250,10 +296,20 @@ def validate_a2ui_json(json_string: str, schema: dict[str, Any] | None = None) -
         if not isinstance(parsed, list):
             return False, None, "A2UI JSON must be a list of messages"
 
-        # Validate against schema
+        # Validate against schema, preferring the precompiled default validator
+        if schema is None and _A2UI_ARRAY_FAST_VALIDATOR is not None:
+            try:
+                _A2UI_ARRAY_FAST_VALIDATOR(parsed)
+            except fastjsonschema.JsonSchemaException as e:
+                return False, None, f"Schema validation failed: {e.message}"
+            return True, parsed, None
+
         try:
             import jsonschema
-            jsonschema.validate(instance=parsed, schema=schema)
+            if schema is None:
+                A2UI_ARRAY_VALIDATOR.validate(parsed)
+            else:
+                jsonschema.validate(instance=parsed, schema=schema)
         except ImportError:
             logger.warning("jsonschema not installed, skipping validation")
         except jsonschema.exceptions.ValidationError as e:
@@ -278,12 +334,12 @@ def parse_a2ui_response(response: str) -> tuple[str, list[dict[str, Any]] | None
         Tuple of (text_content, a2ui_messages).
         a2ui_messages is None if no A2UI JSON found or if parsing failed.
     """
-    if A2UI_DELIMITER not in response:
+    text_content, sep, json_string = response.partition(A2UI_DELIMITER)
+    if not sep:
         return response, None
 
-    parts = response.split(A2UI_DELIMITER, 1)
-    text_content = parts[0].strip()
-    json_string = parts[1].strip() if len(parts) > 1 else ""
+    text_content = text_content.strip()
+    json_string = json_string.strip()
 
     if not json_string:
         return text_content, None
@@ -300,6 +356,7 @@ def get_a2ui_schema() -> dict[str, Any]:
     """Get the A2UI message schema wrapped for array validation.
 
     Returns:
-        The A2UI schema as a Python dict, ready for jsonschema validation.
+        The shared, read-only A2UI array schema, ready for jsonschema
+        validation.
     """
-    return wrap_as_json_array(A2UI_MESSAGE_SCHEMA)
+    return A2UI_MESSAGE_ARRAY_SCHEMA
@@ -1,6 +1,16 @@
 """A2UI JSON Schema definitions."""
 
-from typing import Any
+from typing import Any, NoReturn
+
+try:
+    from jsonschema import Draft202012Validator
+except ImportError:
+    Draft202012Validator = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 # A2UI Message Schema - based on v0.8 specification
 A2UI_MESSAGE_SCHEMA: dict[str, Any] = {
@@ -176,6 +186,50 @@ A2UI_STANDARD_CATALOG: dict[str, Any] = {
 }
 
 
+def _readonly(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(f"{type(self).__name__} is read-only")
+
+
+class _FrozenDict(dict):
+    """A read-only dict.
+
+    Still a real ``dict`` so it serializes with json/orjson and passes
+    schema validators' type checks, but any mutation raises ``TypeError``.
+    Copying (``copy.copy``/``copy.deepcopy``/pickle) yields a plain dict.
+    """
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+
+class _FrozenList(list):
+    """A read-only list, see ``_FrozenDict``."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (list, (list(self),))
+
+
+def _deep_freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists to read-only equivalents."""
+    if isinstance(value, dict):
+        return _FrozenDict((k, _deep_freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_deep_freeze(v) for v in value)
+    return value
+
+
+# Freeze the module-level schema and catalog so that accidental mutation
+# cannot invalidate the validators compiled from them
+A2UI_MESSAGE_SCHEMA = _deep_freeze(A2UI_MESSAGE_SCHEMA)
+A2UI_STANDARD_CATALOG = _deep_freeze(A2UI_STANDARD_CATALOG)
+
+
 def wrap_as_json_array(schema: dict[str, Any]) -> dict[str, Any]:
     """Wraps the A2UI schema in an array to support multiple messages.
 
@@ -191,3 +245,32 @@ def wrap_as_json_array(schema: dict[str, Any]) -> dict[str, Any]:
     if not schema:
         raise ValueError("A2UI schema is empty")
     return {"type": "array", "items": schema}
+
+
+# The array-wrapped A2UI schema, built once and shared by all internal callers
+A2UI_MESSAGE_ARRAY_SCHEMA: dict[str, Any] = _deep_freeze(
+    wrap_as_json_array(A2UI_MESSAGE_SCHEMA)
+)
+
+
+# Validators compiled once at import time (None if jsonschema is not installed)
+if Draft202012Validator is not None:
+    A2UI_MESSAGE_VALIDATOR = Draft202012Validator(A2UI_MESSAGE_SCHEMA)
+    A2UI_ARRAY_VALIDATOR = Draft202012Validator(A2UI_MESSAGE_ARRAY_SCHEMA)
+else:
+    A2UI_MESSAGE_VALIDATOR = None
+    A2UI_ARRAY_VALIDATOR = None
+
+# Fast validator for arrays of A2UI messages. Prefer the module generated by
+# tools/compile_a2ui_schema.py; otherwise compile at import time (None if
+# fastjsonschema is not installed).
+try:
+    from langchain_ucp.a2ui._compiled_validator import (
+        validate as _A2UI_ARRAY_FAST_VALIDATOR,
+    )
+except ImportError:
+    _A2UI_ARRAY_FAST_VALIDATOR = (
+        fastjsonschema.compile(A2UI_MESSAGE_ARRAY_SCHEMA)
+        if fastjsonschema is not None
+        else None
+    )
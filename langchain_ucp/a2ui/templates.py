@@ -9,6 +9,9 @@ This module provides pre-built templates for common commerce UIs:
 These templates can be used by LLM agents to render rich UIs.
 """
 
+import json
+import sys
+from json.encoder import encode_basestring
 from typing import Any
 
 from langchain_ucp.a2ui.constants import (
@@ -19,12 +22,323 @@ from langchain_ucp.a2ui.constants import (
     SURFACE_ID_PRODUCT_DETAIL,
     SURFACE_ID_PRODUCTS,
 )
+from langchain_ucp.a2ui.schema import _deep_freeze
 from langchain_ucp.a2ui.types import (
     A2UIMessage,
     Component,
     DataEntry,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    _to_json_bytes = orjson.dumps
+else:
+
+    def _to_json_bytes(obj: Any) -> bytes:
+        """Serialize to compact JSON bytes using the standard library."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# -----------------------------------------------------------------------------
+# Component Definitions
+# -----------------------------------------------------------------------------
+
+# Components are static, so they are built once at import time and shared.
+# They are deep-frozen: still real lists/dicts (so every validator and
+# serializer accepts them), but any mutation raises TypeError.
+
+_PRODUCT_CARD_COMPONENTS: list[dict[str, Any]] = _deep_freeze([
+    {"id": "card", "component": {"Card": {"child": "card-content"}}},
+    {"id": "card-content", "component": {"Column": {
+        "children": {"explicitList": [
+            "product-image",
+            "product-info",
+            "product-actions"
+        ]}
+    }}},
+    {"id": "product-image", "component": {"Image": {
+        "url": {"path": "imageUrl"},
+        "usageHint": "largeFeature",
+        "fit": "cover"
+    }}},
+    {"id": "product-info", "component": {"Column": {
+        "children": {"explicitList": [
+            "product-name",
+            "product-price",
+            "product-description"
+        ]}
+    }}},
+    {"id": "product-name", "component": {"Text": {
+        "text": {"path": "name"},
+        "usageHint": "h2"
+    }}},
+    {"id": "product-price", "component": {"Text": {
+        "text": {"path": "price"},
+        "usageHint": "h3"
+    }}},
+    {"id": "product-description", "component": {"Text": {
+        "text": {"path": "description"},
+        "usageHint": "body"
+    }}},
+    {"id": "product-actions", "component": {"Row": {
+        "children": {"explicitList": ["add-to-cart-btn"]},
+        "distribution": "end"
+    }}},
+    {"id": "add-to-cart-btn", "component": {"Button": {
+        "child": "add-btn-text",
+        "primary": True,
+        "action": {
+            "name": "add_to_cart",
+            "context": [
+                {"key": "productId", "value": {"path": "id"}},
+                {"key": "quantity", "value": {"literalNumber": 1}}
+            ]
+        }
+    }}},
+    {"id": "add-btn-text", "component": {"Text": {
+        "text": {"literalString": "Add to Cart"}
+    }}}
+])
+
+_PRODUCT_LIST_COMPONENTS: list[dict[str, Any]] = _deep_freeze([
+    {"id": "root", "component": {"Column": {
+        "children": {"explicitList": ["page-title", "product-list"]}
+    }}},
+    {"id": "page-title", "component": {"Text": {
+        "text": {"path": "title"},
+        "usageHint": "h1"
+    }}},
+    {"id": "product-list", "component": {"List": {
+        "direction": "vertical",
+        "children": {"template": {
+            "componentId": "product-item",
+            "dataBinding": "/products"
+        }}
+    }}},
+    {"id": "product-item", "component": {"Card": {"child": "item-content"}}},
+    {"id": "item-content", "component": {"Row": {
+        "children": {"explicitList": ["item-image", "item-details"]},
+        "alignment": "center"
+    }}},
+    {"id": "item-image", "weight": 1, "component": {"Image": {
+        "url": {"path": "imageUrl"},
+        "usageHint": "mediumFeature"
+    }}},
+    {"id": "item-details", "weight": 2, "component": {"Column": {
+        "children": {"explicitList": [
+            "item-name",
+            "item-price",
+            "item-add-btn"
+        ]}
+    }}},
+    {"id": "item-name", "component": {"Text": {
+        "text": {"path": "name"},
+        "usageHint": "h3"
+    }}},
+    {"id": "item-price", "component": {"Text": {
+        "text": {"path": "price"},
+        "usageHint": "body"
+    }}},
+    {"id": "item-add-btn", "component": {"Button": {
+        "child": "item-btn-text",
+        "primary": True,
+        "action": {
+            "name": "add_to_cart",
+            "context": [
+                {"key": "productId", "value": {"path": "id"}}
+            ]
+        }
+    }}},
+    {"id": "item-btn-text", "component": {"Text": {
+        "text": {"literalString": "Add to Cart"}
+    }}}
+])
+
+_CHECKOUT_COMPONENTS: list[dict[str, Any]] = _deep_freeze([
+    {"id": "checkout-root", "component": {"Column": {
+        "children": {"explicitList": [
+            "checkout-title",
+            "checkout-divider",
+            "order-summary",
+            "shipping-section",
+            "checkout-actions"
+        ]}
+    }}},
+    {"id": "checkout-title", "component": {"Text": {
+        "text": {"literalString": "Checkout"},
+        "usageHint": "h1"
+    }}},
+    {"id": "checkout-divider", "component": {"Divider": {}}},
+    
+    # Order Summary
+    {"id": "order-summary", "component": {"Column": {
+        "children": {"explicitList": [
+            "summary-title",
+            "items-list",
+            "total-row"
+        ]}
+    }}},
+    {"id": "summary-title", "component": {"Text": {
+        "text": {"literalString": "Order Summary"},
+        "usageHint": "h3"
+    }}},
+    {"id": "items-list", "component": {"List": {
+        "direction": "vertical",
+        "children": {"template": {
+            "componentId": "checkout-item",
+            "dataBinding": "/items"
+        }}
+    }}},
+    {"id": "checkout-item", "component": {"Row": {
+        "children": {"explicitList": ["item-title", "item-qty", "item-total"]},
+        "distribution": "spaceBetween"
+    }}},
+    {"id": "item-title", "component": {"Text": {"text": {"path": "title"}}}},
+    {"id": "item-qty", "component": {"Text": {"text": {"path": "quantity"}}}},
+    {"id": "item-total", "component": {"Text": {"text": {"path": "total"}}}},
+    {"id": "total-row", "component": {"Row": {
+        "children": {"explicitList": ["total-label", "total-value"]},
+        "distribution": "spaceBetween"
+    }}},
+    {"id": "total-label", "component": {"Text": {
+        "text": {"literalString": "Total:"},
+        "usageHint": "h4"
+    }}},
+    {"id": "total-value", "component": {"Text": {
+        "text": {"path": "total"},
+        "usageHint": "h4"
+    }}},
+    
+    # Shipping Section
+    {"id": "shipping-section", "component": {"Column": {
+        "children": {"explicitList": [
+            "shipping-title",
+            "name-row",
+            "address-field",
+            "city-row",
+            "email-field"
+        ]}
+    }}},
+    {"id": "shipping-title", "component": {"Text": {
+        "text": {"literalString": "Shipping Address"},
+        "usageHint": "h3"
+    }}},
+    {"id": "name-row", "component": {"Row": {
+        "children": {"explicitList": ["first-name-field", "last-name-field"]}
+    }}},
+    {"id": "first-name-field", "weight": 1, "component": {"TextField": {
+        "label": {"literalString": "First Name"},
+        "text": {"path": "firstName"}
+    }}},
+    {"id": "last-name-field", "weight": 1, "component": {"TextField": {
+        "label": {"literalString": "Last Name"},
+        "text": {"path": "lastName"}
+    }}},
+    {"id": "address-field", "component": {"TextField": {
+        "label": {"literalString": "Street Address"},
+        "text": {"path": "streetAddress"}
+    }}},
+    {"id": "city-row", "component": {"Row": {
+        "children": {"explicitList": ["city-field", "state-field", "zip-field"]}
+    }}},
+    {"id": "city-field", "weight": 2, "component": {"TextField": {
+        "label": {"literalString": "City"},
+        "text": {"path": "city"}
+    }}},
+    {"id": "state-field", "weight": 1, "component": {"TextField": {
+        "label": {"literalString": "State"},
+        "text": {"path": "state"}
+    }}},
+    {"id": "zip-field", "weight": 1, "component": {"TextField": {
+        "label": {"literalString": "ZIP Code"},
+        "text": {"path": "zipCode"}
+    }}},
+    {"id": "email-field", "component": {"TextField": {
+        "label": {"literalString": "Email"},
+        "text": {"path": "email"}
+    }}},
+    
+    # Actions
+    {"id": "checkout-actions", "component": {"Row": {
+        "children": {"explicitList": ["cancel-btn", "place-order-btn"]},
+        "distribution": "spaceBetween"
+    }}},
+    {"id": "cancel-btn", "component": {"Button": {
+        "child": "cancel-text",
+        "action": {"name": "cancel_checkout"}
+    }}},
+    {"id": "cancel-text", "component": {"Text": {
+        "text": {"literalString": "Cancel"}
+    }}},
+    {"id": "place-order-btn", "component": {"Button": {
+        "child": "place-order-text",
+        "primary": True,
+        "action": {
+            "name": "place_order",
+            "context": [
+                {"key": "checkoutId", "value": {"path": "checkoutId"}}
+            ]
+        }
+    }}},
+    {"id": "place-order-text", "component": {"Text": {
+        "text": {"literalString": "Place Order"}
+    }}}
+])
+
+_ORDER_CONFIRMATION_COMPONENTS: list[dict[str, Any]] = _deep_freeze([
+    {"id": "confirmation-root", "component": {"Card": {
+        "child": "confirmation-content"
+    }}},
+    {"id": "confirmation-content", "component": {"Column": {
+        "children": {"explicitList": [
+            "success-icon",
+            "confirmation-title",
+            "order-id",
+            "divider",
+            "items-summary",
+            "total-section",
+            "shipping-info"
+        ]},
+        "alignment": "center"
+    }}},
+    {"id": "success-icon", "component": {"Icon": {
+        "name": {"literalString": "check"}
+    }}},
+    {"id": "confirmation-title", "component": {"Text": {
+        "text": {"literalString": "Order Confirmed!"},
+        "usageHint": "h1"
+    }}},
+    {"id": "order-id", "component": {"Text": {
+        "text": {"path": "orderIdDisplay"},
+        "usageHint": "body"
+    }}},
+    {"id": "divider", "component": {"Divider": {}}},
+    {"id": "items-summary", "component": {"Text": {
+        "text": {"path": "itemsSummary"},
+        "usageHint": "body"
+    }}},
+    {"id": "total-section", "component": {"Text": {
+        "text": {"path": "totalDisplay"},
+        "usageHint": "h3"
+    }}},
+    {"id": "shipping-info", "component": {"Column": {
+        "children": {"explicitList": ["shipping-label", "shipping-address"]}
+    }}},
+    {"id": "shipping-label", "component": {"Text": {
+        "text": {"literalString": "Shipping to:"},
+        "usageHint": "caption"
+    }}},
+    {"id": "shipping-address", "component": {"Text": {
+        "text": {"path": "shippingAddress"},
+        "usageHint": "body"
+    }}}
+])
+
 
 # -----------------------------------------------------------------------------
 # Template Classes
@@ -39,61 +353,12 @@ class ProductCardTemplate:
 
     SURFACE_ID = SURFACE_ID_PRODUCT_DETAIL
 
-    @staticmethod
-    def get_components() -> list[dict[str, Any]]:
-        """Get component definitions for product card."""
-        return [
-            {"id": "card", "component": {"Card": {"child": "card-content"}}},
-            {"id": "card-content", "component": {"Column": {
-                "children": {"explicitList": [
-                    "product-image",
-                    "product-info",
-                    "product-actions"
-                ]}
-            }}},
-            {"id": "product-image", "component": {"Image": {
-                "url": {"path": "imageUrl"},
-                "usageHint": "largeFeature",
-                "fit": "cover"
-            }}},
-            {"id": "product-info", "component": {"Column": {
-                "children": {"explicitList": [
-                    "product-name",
-                    "product-price",
-                    "product-description"
-                ]}
-            }}},
-            {"id": "product-name", "component": {"Text": {
-                "text": {"path": "name"},
-                "usageHint": "h2"
-            }}},
-            {"id": "product-price", "component": {"Text": {
-                "text": {"path": "price"},
-                "usageHint": "h3"
-            }}},
-            {"id": "product-description", "component": {"Text": {
-                "text": {"path": "description"},
-                "usageHint": "body"
-            }}},
-            {"id": "product-actions", "component": {"Row": {
-                "children": {"explicitList": ["add-to-cart-btn"]},
-                "distribution": "end"
-            }}},
-            {"id": "add-to-cart-btn", "component": {"Button": {
-                "child": "add-btn-text",
-                "primary": True,
-                "action": {
-                    "name": "add_to_cart",
-                    "context": [
-                        {"key": "productId", "value": {"path": "id"}},
-                        {"key": "quantity", "value": {"literalNumber": 1}}
-                    ]
-                }
-            }}},
-            {"id": "add-btn-text", "component": {"Text": {
-                "text": {"literalString": "Add to Cart"}
-            }}}
-        ]
+    COMPONENTS = _PRODUCT_CARD_COMPONENTS
+
+    @classmethod
+    def get_components(cls) -> list[dict[str, Any]]:
+        """Get component definitions for product card (prefer ``COMPONENTS``)."""
+        return cls.COMPONENTS
 
 
 class ProductListTemplate:
@@ -104,62 +369,12 @@ class ProductListTemplate:
 
     SURFACE_ID = SURFACE_ID_PRODUCTS
 
-    @staticmethod
-    def get_components() -> list[dict[str, Any]]:
-        """Get component definitions for product list."""
-        return [
-            {"id": "root", "component": {"Column": {
-                "children": {"explicitList": ["page-title", "product-list"]}
-            }}},
-            {"id": "page-title", "component": {"Text": {
-                "text": {"path": "title"},
-                "usageHint": "h1"
-            }}},
-            {"id": "product-list", "component": {"List": {
-                "direction": "vertical",
-                "children": {"template": {
-                    "componentId": "product-item",
-                    "dataBinding": "/products"
-                }}
-            }}},
-            {"id": "product-item", "component": {"Card": {"child": "item-content"}}},
-            {"id": "item-content", "component": {"Row": {
-                "children": {"explicitList": ["item-image", "item-details"]},
-                "alignment": "center"
-            }}},
-            {"id": "item-image", "weight": 1, "component": {"Image": {
-                "url": {"path": "imageUrl"},
-                "usageHint": "mediumFeature"
-            }}},
-            {"id": "item-details", "weight": 2, "component": {"Column": {
-                "children": {"explicitList": [
-                    "item-name",
-                    "item-price",
-                    "item-add-btn"
-                ]}
-            }}},
-            {"id": "item-name", "component": {"Text": {
-                "text": {"path": "name"},
-                "usageHint": "h3"
-            }}},
-            {"id": "item-price", "component": {"Text": {
-                "text": {"path": "price"},
-                "usageHint": "body"
-            }}},
-            {"id": "item-add-btn", "component": {"Button": {
-                "child": "item-btn-text",
-                "primary": True,
-                "action": {
-                    "name": "add_to_cart",
-                    "context": [
-                        {"key": "productId", "value": {"path": "id"}}
-                    ]
-                }
-            }}},
-            {"id": "item-btn-text", "component": {"Text": {
-                "text": {"literalString": "Add to Cart"}
-            }}}
-        ]
+    COMPONENTS = _PRODUCT_LIST_COMPONENTS
+
+    @classmethod
+    def get_components(cls) -> list[dict[str, Any]]:
+        """Get component definitions for product list (prefer ``COMPONENTS``)."""
+        return cls.COMPONENTS
 
 
 class CheckoutTemplate:
@@ -170,139 +385,12 @@ class CheckoutTemplate:
 
     SURFACE_ID = SURFACE_ID_CHECKOUT
 
-    @staticmethod
-    def get_components() -> list[dict[str, Any]]:
-        """Get component definitions for checkout form."""
-        return [
-            {"id": "checkout-root", "component": {"Column": {
-                "children": {"explicitList": [
-                    "checkout-title",
-                    "checkout-divider",
-                    "order-summary",
-                    "shipping-section",
-                    "checkout-actions"
-                ]}
-            }}},
-            {"id": "checkout-title", "component": {"Text": {
-                "text": {"literalString": "Checkout"},
-                "usageHint": "h1"
-            }}},
-            {"id": "checkout-divider", "component": {"Divider": {}}},
-            
-            # Order Summary
-            {"id": "order-summary", "component": {"Column": {
-                "children": {"explicitList": [
-                    "summary-title",
-                    "items-list",
-                    "total-row"
-                ]}
-            }}},
-            {"id": "summary-title", "component": {"Text": {
-                "text": {"literalString": "Order Summary"},
-                "usageHint": "h3"
-            }}},
-            {"id": "items-list", "component": {"List": {
-                "direction": "vertical",
-                "children": {"template": {
-                    "componentId": "checkout-item",
-                    "dataBinding": "/items"
-                }}
-            }}},
-            {"id": "checkout-item", "component": {"Row": {
-                "children": {"explicitList": ["item-title", "item-qty", "item-total"]},
-                "distribution": "spaceBetween"
-            }}},
-            {"id": "item-title", "component": {"Text": {"text": {"path": "title"}}}},
-            {"id": "item-qty", "component": {"Text": {"text": {"path": "quantity"}}}},
-            {"id": "item-total", "component": {"Text": {"text": {"path": "total"}}}},
-            {"id": "total-row", "component": {"Row": {
-                "children": {"explicitList": ["total-label", "total-value"]},
-                "distribution": "spaceBetween"
-            }}},
-            {"id": "total-label", "component": {"Text": {
-                "text": {"literalString": "Total:"},
-                "usageHint": "h4"
-            }}},
-            {"id": "total-value", "component": {"Text": {
-                "text": {"path": "total"},
-                "usageHint": "h4"
-            }}},
-            
-            # Shipping Section
-            {"id": "shipping-section", "component": {"Column": {
-                "children": {"explicitList": [
-                    "shipping-title",
-                    "name-row",
-                    "address-field",
-                    "city-row",
-                    "email-field"
-                ]}
-            }}},
-            {"id": "shipping-title", "component": {"Text": {
-                "text": {"literalString": "Shipping Address"},
-                "usageHint": "h3"
-            }}},
-            {"id": "name-row", "component": {"Row": {
-                "children": {"explicitList": ["first-name-field", "last-name-field"]}
-            }}},
-            {"id": "first-name-field", "weight": 1, "component": {"TextField": {
-                "label": {"literalString": "First Name"},
-                "text": {"path": "firstName"}
-            }}},
-            {"id": "last-name-field", "weight": 1, "component": {"TextField": {
-                "label": {"literalString": "Last Name"},
-                "text": {"path": "lastName"}
-            }}},
-            {"id": "address-field", "component": {"TextField": {
-                "label": {"literalString": "Street Address"},
-                "text": {"path": "streetAddress"}
-            }}},
-            {"id": "city-row", "component": {"Row": {
-                "children": {"explicitList": ["city-field", "state-field", "zip-field"]}
-            }}},
-            {"id": "city-field", "weight": 2, "component": {"TextField": {
-                "label": {"literalString": "City"},
-                "text": {"path": "city"}
-            }}},
-            {"id": "state-field", "weight": 1, "component": {"TextField": {
-                "label": {"literalString": "State"},
-                "text": {"path": "state"}
-            }}},
-            {"id": "zip-field", "weight": 1, "component": {"TextField": {
-                "label": {"literalString": "ZIP Code"},
-                "text": {"path": "zipCode"}
-            }}},
-            {"id": "email-field", "component": {"TextField": {
-                "label": {"literalString": "Email"},
-                "text": {"path": "email"}
-            }}},
-            
-            # Actions
-            {"id": "checkout-actions", "component": {"Row": {
-                "children": {"explicitList": ["cancel-btn", "place-order-btn"]},
-                "distribution": "spaceBetween"
-            }}},
-            {"id": "cancel-btn", "component": {"Button": {
-                "child": "cancel-text",
-                "action": {"name": "cancel_checkout"}
-            }}},
-            {"id": "cancel-text", "component": {"Text": {
-                "text": {"literalString": "Cancel"}
-            }}},
-            {"id": "place-order-btn", "component": {"Button": {
-                "child": "place-order-text",
-                "primary": True,
-                "action": {
-                    "name": "place_order",
-                    "context": [
-                        {"key": "checkoutId", "value": {"path": "checkoutId"}}
-                    ]
-                }
-            }}},
-            {"id": "place-order-text", "component": {"Text": {
-                "text": {"literalString": "Place Order"}
-            }}}
-        ]
+    COMPONENTS = _CHECKOUT_COMPONENTS
+
+    @classmethod
+    def get_components(cls) -> list[dict[str, Any]]:
+        """Get component definitions for checkout form (prefer ``COMPONENTS``)."""
+        return cls.COMPONENTS
 
 
 class OrderConfirmationTemplate:
@@ -313,57 +401,176 @@ class OrderConfirmationTemplate:
 
     SURFACE_ID = SURFACE_ID_ORDER_CONFIRMATION
 
-    @staticmethod
-    def get_components() -> list[dict[str, Any]]:
-        """Get component definitions for order confirmation."""
-        return [
-            {"id": "confirmation-root", "component": {"Card": {
-                "child": "confirmation-content"
-            }}},
-            {"id": "confirmation-content", "component": {"Column": {
-                "children": {"explicitList": [
-                    "success-icon",
-                    "confirmation-title",
-                    "order-id",
-                    "divider",
-                    "items-summary",
-                    "total-section",
-                    "shipping-info"
-                ]},
-                "alignment": "center"
-            }}},
-            {"id": "success-icon", "component": {"Icon": {
-                "name": {"literalString": "check"}
-            }}},
-            {"id": "confirmation-title", "component": {"Text": {
-                "text": {"literalString": "Order Confirmed!"},
-                "usageHint": "h1"
-            }}},
-            {"id": "order-id", "component": {"Text": {
-                "text": {"path": "orderIdDisplay"},
-                "usageHint": "body"
-            }}},
-            {"id": "divider", "component": {"Divider": {}}},
-            {"id": "items-summary", "component": {"Text": {
-                "text": {"path": "itemsSummary"},
-                "usageHint": "body"
-            }}},
-            {"id": "total-section", "component": {"Text": {
-                "text": {"path": "totalDisplay"},
-                "usageHint": "h3"
-            }}},
-            {"id": "shipping-info", "component": {"Column": {
-                "children": {"explicitList": ["shipping-label", "shipping-address"]}
-            }}},
-            {"id": "shipping-label", "component": {"Text": {
-                "text": {"literalString": "Shipping to:"},
-                "usageHint": "caption"
-            }}},
-            {"id": "shipping-address", "component": {"Text": {
-                "text": {"path": "shippingAddress"},
-                "usageHint": "body"
-            }}}
-        ]
+    COMPONENTS = _ORDER_CONFIRMATION_COMPONENTS
+
+    @classmethod
+    def get_components(cls) -> list[dict[str, Any]]:
+        """Get component definitions for order confirmation (prefer ``COMPONENTS``)."""
+        return cls.COMPONENTS
+
+
+# Precomputed surfaceUpdate messages - identical for every call, so they are
+# shared by reference and deep-frozen like the components
+_PRODUCT_CARD_SURFACE_UPDATE: dict[str, Any] = _deep_freeze({
+    "surfaceUpdate": {
+        "surfaceId": ProductCardTemplate.SURFACE_ID,
+        "components": ProductCardTemplate.COMPONENTS,
+    }
+})
+_PRODUCT_LIST_SURFACE_UPDATE: dict[str, Any] = _deep_freeze({
+    "surfaceUpdate": {
+        "surfaceId": ProductListTemplate.SURFACE_ID,
+        "components": ProductListTemplate.COMPONENTS,
+    }
+})
+_CHECKOUT_SURFACE_UPDATE: dict[str, Any] = _deep_freeze({
+    "surfaceUpdate": {
+        "surfaceId": CheckoutTemplate.SURFACE_ID,
+        "components": CheckoutTemplate.COMPONENTS,
+    }
+})
+_ORDER_CONFIRMATION_SURFACE_UPDATE: dict[str, Any] = _deep_freeze({
+    "surfaceUpdate": {
+        "surfaceId": OrderConfirmationTemplate.SURFACE_ID,
+        "components": OrderConfirmationTemplate.COMPONENTS,
+    }
+})
+
+def _begin_rendering(surface_id: str, root: str, primary_color: str) -> dict[str, Any]:
+    """Build a beginRendering message for a surface."""
+    return {
+        "beginRendering": {
+            "surfaceId": surface_id,
+            "root": root,
+            "styles": {"primaryColor": primary_color, "font": DEFAULT_FONT}
+        }
+    }
+
+
+def _data_model_update(
+    surface_id: str, contents: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Build a dataModelUpdate message replacing a surface's root data."""
+    return {
+        "dataModelUpdate": {
+            "surfaceId": surface_id,
+            "path": "/",
+            "contents": contents,
+        }
+    }
+
+
+# Precomputed (beginRendering, surfaceUpdate) pairs for the default color,
+# deep-frozen since they are returned by reference
+_PRODUCT_CARD_SKELETON = (
+    _deep_freeze(
+        _begin_rendering(ProductCardTemplate.SURFACE_ID, "card", DEFAULT_PRIMARY_COLOR)
+    ),
+    _PRODUCT_CARD_SURFACE_UPDATE,
+)
+_PRODUCT_LIST_SKELETON = (
+    _deep_freeze(
+        _begin_rendering(ProductListTemplate.SURFACE_ID, "root", DEFAULT_PRIMARY_COLOR)
+    ),
+    _PRODUCT_LIST_SURFACE_UPDATE,
+)
+_CHECKOUT_SKELETON = (
+    _deep_freeze(_begin_rendering(
+        CheckoutTemplate.SURFACE_ID, "checkout-root", DEFAULT_PRIMARY_COLOR
+    )),
+    _CHECKOUT_SURFACE_UPDATE,
+)
+_ORDER_CONFIRMATION_SKELETON = (
+    _deep_freeze(_begin_rendering(
+        OrderConfirmationTemplate.SURFACE_ID, "confirmation-root", DEFAULT_PRIMARY_COLOR
+    )),
+    _ORDER_CONFIRMATION_SURFACE_UPDATE,
+)
+
+# Serialized skeletons, so the static part is only encoded once
+_PRODUCT_CARD_SKELETON_JSON: tuple[bytes, bytes] = (
+    _to_json_bytes(_PRODUCT_CARD_SKELETON[0]),
+    _to_json_bytes(_PRODUCT_CARD_SKELETON[1]),
+)
+_PRODUCT_LIST_SKELETON_JSON: tuple[bytes, bytes] = (
+    _to_json_bytes(_PRODUCT_LIST_SKELETON[0]),
+    _to_json_bytes(_PRODUCT_LIST_SKELETON[1]),
+)
+
+
+def _skeleton(
+    skeleton: tuple[dict[str, Any], dict[str, Any]], primary_color: str
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Get the static messages for a template, restyled if the color differs."""
+    if primary_color == DEFAULT_PRIMARY_COLOR:
+        return skeleton
+    begin, surface_update = skeleton
+    rendering = begin["beginRendering"]
+    return (
+        _begin_rendering(rendering["surfaceId"], rendering["root"], primary_color),
+        surface_update,
+    )
+
+
+# Checkout shipping fields always start empty so the user fills them in.
+# Spliced into every checkout payload, so they are deep-frozen.
+_EMPTY_SHIPPING_ENTRIES: list[dict[str, Any]] = _deep_freeze([
+    {"key": "firstName", "valueString": ""},
+    {"key": "lastName", "valueString": ""},
+    {"key": "streetAddress", "valueString": ""},
+    {"key": "city", "valueString": ""},
+    {"key": "state", "valueString": ""},
+    {"key": "zipCode", "valueString": ""},
+    {"key": "email", "valueString": ""},
+])
+
+# Interned data model keys for typical list sizes, reused across calls
+_MAX_CACHED_KEYS = 256
+_PRODUCT_KEYS = tuple(sys.intern(f"product_{i}") for i in range(_MAX_CACHED_KEYS))
+_ITEM_KEYS = tuple(sys.intern(f"item_{i}") for i in range(_MAX_CACHED_KEYS))
+
+# String forms of small ints, so typical quantities skip str() per item
+_MAX_SMALL_INT = 1024
+_SMALL_INT_STR = tuple(sys.intern(str(i)) for i in range(_MAX_SMALL_INT))
+
+# Product lists at least this long are serialized column-wise instead of
+# building a dict per product first
+_SOA_MIN_PRODUCTS = 32
+
+_PRODUCT_ENTRY_JSON = (
+    '{"key":"%s","valueMap":[{"key":"id","valueString":%s},'
+    '{"key":"name","valueString":%s},{"key":"price","valueString":%s},'
+    '{"key":"imageUrl","valueString":%s}]}'
+)
+
+
+def _build_products_data_soa(products: list[dict[str, Any]]) -> str | None:
+    """Serialize the product list data model entries to a JSON array body.
+
+    Collects ids, names, prices and image URLs into parallel columns and
+    formats each entry directly, so no per-product dicts are allocated.
+
+    Returns:
+        The comma-joined JSON entries, or None if any value is not a string.
+    """
+    columns = [
+        [product.get(field, "") for product in products]
+        for field in ("id", "name", "price", "imageUrl")
+    ]
+    if not all(type(value) is str for column in columns for value in column):
+        return None
+
+    keys = (
+        _PRODUCT_KEYS[i] if i < _MAX_CACHED_KEYS else f"product_{i}"
+        for i in range(len(products))
+    )
+    ids, names, prices, image_urls = (
+        [encode_basestring(value) for value in column] for column in columns
+    )
+    return ",".join([
+        _PRODUCT_ENTRY_JSON % entry
+        for entry in zip(keys, ids, names, prices, image_urls)
+    ])
 
 
 # -----------------------------------------------------------------------------
@@ -395,35 +602,52 @@ def create_product_card(
     surface_id = ProductCardTemplate.SURFACE_ID
 
     return [
-        {
-            "beginRendering": {
-                "surfaceId": surface_id,
-                "root": "card",
-                "styles": {"primaryColor": primary_color, "font": DEFAULT_FONT}
-            }
-        },
-        {
-            "surfaceUpdate": {
-                "surfaceId": surface_id,
-                "components": ProductCardTemplate.get_components()
-            }
-        },
-        {
-            "dataModelUpdate": {
-                "surfaceId": surface_id,
-                "path": "/",
-                "contents": [
-                    {"key": "id", "valueString": product_id},
-                    {"key": "name", "valueString": name},
-                    {"key": "price", "valueString": price},
-                    {"key": "imageUrl", "valueString": image_url},
-                    {"key": "description", "valueString": description},
-                ]
-            }
-        }
+        *_skeleton(_PRODUCT_CARD_SKELETON, primary_color),
+        _data_model_update(surface_id, [
+            {"key": "id", "valueString": product_id},
+            {"key": "name", "valueString": name},
+            {"key": "price", "valueString": price},
+            {"key": "imageUrl", "valueString": image_url},
+            {"key": "description", "valueString": description},
+        ]),
     ]
 
 
+def create_product_card_bytes(
+    product_id: str,
+    name: str,
+    price: str,
+    image_url: str,
+    description: str = "",
+    primary_color: str = DEFAULT_PRIMARY_COLOR,
+) -> list[bytes]:
+    """Create A2UI messages for a product card, serialized as JSON bytes.
+
+    Produces the same messages as ``create_product_card``, but each one is
+    already encoded. The static messages are serialized once at import time.
+    Join the result with ``b","`` inside brackets to get a JSON array.
+
+    Args:
+        product_id: Unique product identifier.
+        name: Product name.
+        price: Formatted price string (e.g., "$29.99").
+        image_url: URL to product image.
+        description: Product description.
+        primary_color: Primary color for styling.
+
+    Returns:
+        List of serialized A2UI messages ready to be sent.
+    """
+    begin, _, data_update = create_product_card(
+        product_id, name, price, image_url, description, primary_color
+    )
+    begin_json, surface_update_json = _PRODUCT_CARD_SKELETON_JSON
+    if primary_color != DEFAULT_PRIMARY_COLOR:
+        begin_json = _to_json_bytes(begin)
+
+    return [begin_json, surface_update_json, _to_json_bytes(data_update)]
+
+
 def create_product_list(
     title: str,
     products: list[dict[str, Any]],
@@ -442,10 +666,9 @@ def create_product_list(
     surface_id = ProductListTemplate.SURFACE_ID
 
     # Convert products to data model format
-    products_data = []
-    for i, product in enumerate(products):
-        product_entry = {
-            "key": f"product_{i}",
+    products_data = [
+        {
+            "key": _PRODUCT_KEYS[i] if i < _MAX_CACHED_KEYS else f"product_{i}",
             "valueMap": [
                 {"key": "id", "valueString": product.get("id", "")},
                 {"key": "name", "valueString": product.get("name", "")},
@@ -453,35 +676,59 @@ def create_product_list(
                 {"key": "imageUrl", "valueString": product.get("imageUrl", "")},
             ]
         }
-        products_data.append(product_entry)
+        for i, product in enumerate(products)
+    ]
 
     return [
-        {
-            "beginRendering": {
-                "surfaceId": surface_id,
-                "root": "root",
-                "styles": {"primaryColor": primary_color, "font": DEFAULT_FONT}
-            }
-        },
-        {
-            "surfaceUpdate": {
-                "surfaceId": surface_id,
-                "components": ProductListTemplate.get_components()
-            }
-        },
-        {
-            "dataModelUpdate": {
-                "surfaceId": surface_id,
-                "path": "/",
-                "contents": [
-                    {"key": "title", "valueString": title},
-                    {"key": "products", "valueMap": products_data},
-                ]
-            }
-        }
+        *_skeleton(_PRODUCT_LIST_SKELETON, primary_color),
+        _data_model_update(surface_id, [
+            {"key": "title", "valueString": title},
+            {"key": "products", "valueMap": products_data},
+        ]),
     ]
 
 
+def create_product_list_bytes(
+    title: str,
+    products: list[dict[str, Any]],
+    primary_color: str = DEFAULT_PRIMARY_COLOR,
+) -> list[bytes]:
+    """Create A2UI messages for a product list, serialized as JSON bytes.
+
+    Produces the same messages as ``create_product_list``, but each one is
+    already encoded. Long lists of string-valued products are serialized
+    column-wise without building the intermediate data model dicts.
+
+    Args:
+        title: List title.
+        products: List of product dicts with id, name, price, imageUrl.
+        primary_color: Primary color for styling.
+
+    Returns:
+        List of serialized A2UI messages ready to be sent.
+    """
+    begin_json, surface_update_json = _PRODUCT_LIST_SKELETON_JSON
+    if primary_color != DEFAULT_PRIMARY_COLOR:
+        begin_json = _to_json_bytes(
+            _skeleton(_PRODUCT_LIST_SKELETON, primary_color)[0]
+        )
+
+    products_json = None
+    if len(products) >= _SOA_MIN_PRODUCTS and type(title) is str:
+        products_json = _build_products_data_soa(products)
+
+    if products_json is None:
+        data_update = create_product_list(title, products, primary_color)[2]
+        return [begin_json, surface_update_json, _to_json_bytes(data_update)]
+
+    data_update_json = (
+        '{"dataModelUpdate":{"surfaceId":"%s","path":"/","contents":['
+        '{"key":"title","valueString":%s},'
+        '{"key":"products","valueMap":[%s]}]}}'
+    ) % (ProductListTemplate.SURFACE_ID, encode_basestring(title), products_json)
+    return [begin_json, surface_update_json, data_update_json.encode()]
+
+
 def create_checkout_ui(
     checkout_id: str,
     items: list[dict[str, Any]],
@@ -502,50 +749,31 @@ def create_checkout_ui(
     surface_id = CheckoutTemplate.SURFACE_ID
 
     # Convert items to data model format
-    items_data = []
-    for i, item in enumerate(items):
-        item_entry = {
-            "key": f"item_{i}",
+    items_data = [
+        {
+            "key": _ITEM_KEYS[i] if i < _MAX_CACHED_KEYS else f"item_{i}",
             "valueMap": [
                 {"key": "title", "valueString": item.get("title", "")},
-                {"key": "quantity", "valueString": str(item.get("quantity", 1))},
+                {"key": "quantity", "valueString": (
+                    _SMALL_INT_STR[quantity]
+                    if type(quantity := item.get("quantity", 1)) is int
+                    and 0 <= quantity < _MAX_SMALL_INT
+                    else str(quantity)
+                )},
                 {"key": "total", "valueString": item.get("total", "")},
             ]
         }
-        items_data.append(item_entry)
+        for i, item in enumerate(items)
+    ]
 
     return [
-        {
-            "beginRendering": {
-                "surfaceId": surface_id,
-                "root": "checkout-root",
-                "styles": {"primaryColor": primary_color, "font": DEFAULT_FONT}
-            }
-        },
-        {
-            "surfaceUpdate": {
-                "surfaceId": surface_id,
-                "components": CheckoutTemplate.get_components()
-            }
-        },
-        {
-            "dataModelUpdate": {
-                "surfaceId": surface_id,
-                "path": "/",
-                "contents": [
-                    {"key": "checkoutId", "valueString": checkout_id},
-                    {"key": "items", "valueMap": items_data},
-                    {"key": "total", "valueString": total},
-                    {"key": "firstName", "valueString": ""},
-                    {"key": "lastName", "valueString": ""},
-                    {"key": "streetAddress", "valueString": ""},
-                    {"key": "city", "valueString": ""},
-                    {"key": "state", "valueString": ""},
-                    {"key": "zipCode", "valueString": ""},
-                    {"key": "email", "valueString": ""},
-                ]
-            }
-        }
+        *_skeleton(_CHECKOUT_SKELETON, primary_color),
+        _data_model_update(surface_id, [
+            {"key": "checkoutId", "valueString": checkout_id},
+            {"key": "items", "valueMap": items_data},
+            {"key": "total", "valueString": total},
+            *_EMPTY_SHIPPING_ENTRIES,
+        ]),
     ]
 
 
@@ -571,30 +799,12 @@ def create_order_confirmation(
     surface_id = OrderConfirmationTemplate.SURFACE_ID
 
     return [
-        {
-            "beginRendering": {
-                "surfaceId": surface_id,
-                "root": "confirmation-root",
-                "styles": {"primaryColor": primary_color, "font": DEFAULT_FONT}
-            }
-        },
-        {
-            "surfaceUpdate": {
-                "surfaceId": surface_id,
-                "components": OrderConfirmationTemplate.get_components()
-            }
-        },
-        {
-            "dataModelUpdate": {
-                "surfaceId": surface_id,
-                "path": "/",
-                "contents": [
-                    {"key": "orderId", "valueString": order_id},
-                    {"key": "orderIdDisplay", "valueString": f"Order #{order_id}"},
-                    {"key": "itemsSummary", "valueString": items_summary},
-                    {"key": "totalDisplay", "valueString": f"Total: {total}"},
-                    {"key": "shippingAddress", "valueString": shipping_address},
-                ]
-            }
-        }
+        *_skeleton(_ORDER_CONFIRMATION_SKELETON, primary_color),
+        _data_model_update(surface_id, [
+            {"key": "orderId", "valueString": order_id},
+            {"key": "orderIdDisplay", "valueString": f"Order #{order_id}"},
+            {"key": "itemsSummary", "valueString": items_summary},
+            {"key": "totalDisplay", "valueString": f"Total: {total}"},
+            {"key": "shippingAddress", "valueString": shipping_address},
+        ]),
     ]
@@ -1,7 +1,17 @@
 """A2UI type definitions using Pydantic models."""
 
 from typing import Any, Literal, Union
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializationInfo,
+    field_serializer,
+)
+from pydantic.dataclasses import dataclass
+
+# Shared config for models with camelCase wire aliases
+_ALIASED_CONFIG = ConfigDict(populate_by_name=True)
 
 
 # -----------------------------------------------------------------------------
@@ -9,42 +19,50 @@ from pydantic import BaseModel, Field
 # -----------------------------------------------------------------------------
 
 
-class LiteralValue(BaseModel):
-    """Represents a literal value."""
+class Value(BaseModel):
+    """A literal value or a path reference to the data model.
+
+    One model covers text, number and boolean values; set the literal field
+    matching the kind, or ``path`` to bind to the data model.
+    """
     literal_string: str | None = Field(default=None, alias="literalString")
     literal_number: float | None = Field(default=None, alias="literalNumber")
     literal_boolean: bool | None = Field(default=None, alias="literalBoolean")
+    path: str | None = None
 
-    model_config = {"populate_by_name": True}
-
-
-class PathValue(BaseModel):
-    """Represents a path reference to data model."""
-    path: str
-
+    model_config = _ALIASED_CONFIG
 
-class TextValue(BaseModel):
-    """Text value - literal or path reference."""
-    literal_string: str | None = Field(default=None, alias="literalString")
-    path: str | None = None
+    @classmethod
+    def text(cls, value: str) -> "Value":
+        """Create a literal text value."""
+        return cls(literal_string=value)
 
-    model_config = {"populate_by_name": True}
+    @classmethod
+    def number(cls, value: float) -> "Value":
+        """Create a literal number value."""
+        return cls(literal_number=value)
 
+    @classmethod
+    def boolean(cls, value: bool) -> "Value":
+        """Create a literal boolean value."""
+        return cls(literal_boolean=value)
 
-class NumberValue(BaseModel):
-    """Number value - literal or path reference."""
-    literal_number: float | None = Field(default=None, alias="literalNumber")
-    path: str | None = None
+    @classmethod
+    def bound(cls, path: str) -> "Value":
+        """Create a value bound to a data model path."""
+        return cls(path=path)
 
-    model_config = {"populate_by_name": True}
 
+# Kind-specific names, kept for compatibility
+LiteralValue = Value
+TextValue = Value
+NumberValue = Value
+BooleanValue = Value
 
-class BooleanValue(BaseModel):
-    """Boolean value - literal or path reference."""
-    literal_boolean: bool | None = Field(default=None, alias="literalBoolean")
-    path: str | None = None
 
-    model_config = {"populate_by_name": True}
+class PathValue(BaseModel):
+    """Represents a path reference to data model."""
+    path: str
 
 
 # -----------------------------------------------------------------------------
@@ -52,16 +70,19 @@ class BooleanValue(BaseModel):
 # -----------------------------------------------------------------------------
 
 
-class DataEntry(BaseModel):
-    """A single data entry in the data model."""
+@dataclass(slots=True, config=_ALIASED_CONFIG)
+class DataEntry:
+    """A single data entry in the data model.
+
+    A slotted pydantic dataclass rather than a BaseModel, since data models
+    can hold thousands of entries.
+    """
     key: str
     value_string: str | None = Field(default=None, alias="valueString")
     value_number: float | None = Field(default=None, alias="valueNumber")
     value_boolean: bool | None = Field(default=None, alias="valueBoolean")
     value_map: list["DataEntry"] | None = Field(default=None, alias="valueMap")
 
-    model_config = {"populate_by_name": True}
-
     @classmethod
     def string(cls, key: str, value: str) -> "DataEntry":
         """Create a string data entry."""
@@ -82,6 +103,54 @@ class DataEntry(BaseModel):
         """Create a map data entry."""
         return cls(key=key, value_map=entries)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert entry to its A2UI wire form, omitting unset values."""
+        return _serialize_entries([self])[0]
+
+
+# (field name, wire name) pairs for DataEntry's scalar values
+_DATA_ENTRY_VALUE_FIELDS = (
+    ("value_string", "valueString"),
+    ("value_number", "valueNumber"),
+    ("value_boolean", "valueBoolean"),
+)
+
+
+def _serialize_entries(
+    entries: list[DataEntry],
+    by_alias: bool = True,
+    exclude_none: bool = True,
+) -> list[dict[str, Any]]:
+    """Serialize entries, including nested value maps.
+
+    Walks the tree with an explicit stack, so deeply nested maps cannot hit
+    the recursion limit. JSON output still goes through pydantic-core, which
+    caps nesting depth on its own.
+    """
+    fields = [
+        (name, alias if by_alias else name)
+        for name, alias in _DATA_ENTRY_VALUE_FIELDS
+    ]
+    map_key = "valueMap" if by_alias else "value_map"
+    result: list[dict[str, Any]] = []
+    stack = [(entries, result)]
+    while stack:
+        level, out = stack.pop()
+        for entry in level:
+            data: dict[str, Any] = {"key": entry.key}
+            for name, out_name in fields:
+                value = getattr(entry, name)
+                if value is not None or not exclude_none:
+                    data[out_name] = value
+            if entry.value_map is not None:
+                children: list[dict[str, Any]] = []
+                data[map_key] = children
+                stack.append((entry.value_map, children))
+            elif not exclude_none:
+                data[map_key] = None
+            out.append(data)
+    return result
+
 
 # -----------------------------------------------------------------------------
 # Component Types
@@ -92,7 +161,7 @@ class ExplicitChildren(BaseModel):
     """Explicit list of child component IDs."""
     explicit_list: list[str] = Field(alias="explicitList")
 
-    model_config = {"populate_by_name": True}
+    model_config = _ALIASED_CONFIG
 
 
 class TemplateChildren(BaseModel):
@@ -100,7 +169,7 @@ class TemplateChildren(BaseModel):
     component_id: str = Field(alias="componentId")
     data_binding: str = Field(alias="dataBinding")
 
-    model_config = {"populate_by_name": True}
+    model_config = _ALIASED_CONFIG
 
 
 class Children(BaseModel):
@@ -108,7 +177,7 @@ class Children(BaseModel):
     explicit_list: list[str] | None = Field(default=None, alias="explicitList")
     template: TemplateChildren | None = None
 
-    model_config = {"populate_by_name": True}
+    model_config = _ALIASED_CONFIG
 
 
 class ActionContext(BaseModel):
@@ -135,7 +204,7 @@ class TextComponent(BaseModel):
         default=None, alias="usageHint"
     )
 
-    model_config = {"populate_by_name": True}
+    model_config = _ALIASED_CONFIG
 
 
 class ImageComponent(BaseModel):
@@ -146,7 +215,7 @@ class ImageComponent(BaseModel):
         "icon", "avatar", "smallFeature", "mediumFeature", "largeFeature", "header"
     ] | None = Field(default=None, alias="usageHint")
 
-    model_config = {"populate_by_name": True}
+    model_config = _ALIASED_CONFIG
 
 
 class IconComponent(BaseModel):
@@ -205,7 +274,7 @@ class TextFieldComponent(BaseModel):
     ] | None = Field(default=None, alias="textFieldType")
     validation_regexp: str | None = Field(default=None, alias="validationRegexp")
 
-    model_config = {"populate_by_name": True}
+    model_config = _ALIASED_CONFIG
 
 
 # -----------------------------------------------------------------------------
@@ -230,7 +299,7 @@ class Styles(BaseModel):
     primary_color: str | None = Field(default=None, alias="primaryColor")
     font: str | None = None
 
-    model_config = {"populate_by_name": True}
+    model_config = _ALIASED_CONFIG
 
 
 class BeginRendering(BaseModel):
@@ -240,7 +309,7 @@ class BeginRendering(BaseModel):
     catalog_id: str | None = Field(default=None, alias="catalogId")
     styles: Styles | None = None
 
-    model_config = {"populate_by_name": True}
+    model_config = _ALIASED_CONFIG
 
 
 class SurfaceUpdate(BaseModel):
@@ -248,7 +317,7 @@ class SurfaceUpdate(BaseModel):
     surface_id: str = Field(alias="surfaceId")
     components: list[Component]
 
-    model_config = {"populate_by_name": True}
+    model_config = _ALIASED_CONFIG
 
 
 class DataModelUpdate(BaseModel):
@@ -257,14 +326,23 @@ class DataModelUpdate(BaseModel):
     path: str | None = None
     contents: list[DataEntry]
 
-    model_config = {"populate_by_name": True}
+    model_config = _ALIASED_CONFIG
+
+    @field_serializer("contents")
+    def _serialize_contents(
+        self, contents: list[DataEntry], info: SerializationInfo
+    ) -> list[dict[str, Any]]:
+        """Serialize entries without pydantic's recursive per-node dispatch."""
+        return _serialize_entries(
+            contents, by_alias=bool(info.by_alias), exclude_none=info.exclude_none
+        )
 
 
 class DeleteSurface(BaseModel):
     """Delete surface message."""
     surface_id: str = Field(alias="surfaceId")
 
-    model_config = {"populate_by_name": True}
+    model_config = _ALIASED_CONFIG
 
 
 # -----------------------------------------------------------------------------
@@ -279,7 +357,7 @@ class A2UIMessage(BaseModel):
     data_model_update: DataModelUpdate | None = Field(default=None, alias="dataModelUpdate")
     delete_surface: DeleteSurface | None = Field(default=None, alias="deleteSurface")
 
-    model_config = {"populate_by_name": True}
+    model_config = _ALIASED_CONFIG
 
     @classmethod
     def begin(
@@ -339,3 +417,13 @@ class A2UIMessage(BaseModel):
     def to_dict(self) -> dict[str, Any]:
         """Convert message to dictionary for JSON serialization."""
         return self.model_dump(by_alias=True, exclude_none=True)
+
+    def to_json(self) -> str:
+        """Serialize message directly to a JSON string."""
+        return self.model_dump_json(by_alias=True, exclude_none=True)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize message to UTF-8 JSON bytes in a single pydantic-core pass."""
+        return self.__pydantic_serializer__.to_json(
+            self, by_alias=True, exclude_none=True
+        )
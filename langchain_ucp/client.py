@@ -1,9 +1,11 @@
 """UCP HTTP Client for communicating with UCP-compliant merchants."""
 
+import asyncio
 import json
 import logging
 import uuid
-from datetime import datetime
+from collections.abc import Callable
+from datetime import date
 from typing import Any
 
 import httpx
@@ -24,12 +26,141 @@ from langchain_ucp.exceptions import (
     UCPVersionError,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Constants
 UCP_VERSION = "2026-01-11"
 DEFAULT_AGENT_NAME = "langchain-ucp-agent"
 DEFAULT_TIMEOUT = 30.0
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=100,
+    keepalive_expiry=60.0,
+)
+
+
+def _parse_version(version: str) -> tuple[int, int, int]:
+    """Parse a YYYY-MM-DD UCP version into a comparable tuple.
+
+    Raises:
+        ValueError: If the version is not a valid YYYY-MM-DD date.
+    """
+    digits = version[0:4] + version[5:7] + version[8:10]
+    if len(version) != 10 or version[4] != "-" or version[7] != "-" or not (
+        digits.isascii() and digits.isdigit()
+    ):
+        raise ValueError(f"Invalid UCP version {version!r}, expected YYYY-MM-DD")
+    parsed = (int(version[0:4]), int(version[5:7]), int(version[8:10]))
+    date(*parsed)  # Rejects out-of-range months and days
+    return parsed
+
+
+_AGENT_VERSION = _parse_version(UCP_VERSION)
+
+
+def _encode_payload(payload: dict[str, Any] | BaseModel | None) -> bytes | None:
+    """Serialize a request payload to JSON bytes.
+
+    Request models are dumped straight to JSON by pydantic-core, skipping the
+    intermediate dict and the stdlib encoder.
+    """
+    if payload is None:
+        return None
+    if isinstance(payload, BaseModel):
+        return payload.model_dump_json(by_alias=True, exclude_none=True).encode()
+    return json.dumps(payload).encode()
+
+
+def _capability_version(version: Any) -> Any:
+    """Unwrap a capability version from its pydantic root model, if any."""
+    root = getattr(version, "root", None)
+    return version if root is None else root
+
+
+# -----------------------------------------------------------------------------
+# Error Factories
+# -----------------------------------------------------------------------------
+
+
+def _validation_error(
+    status_code: int, message: str, error_data: dict[str, Any]
+) -> UCPError:
+    """Build a validation error, with per-field details when provided."""
+    if "detail" in error_data and isinstance(error_data["detail"], list):
+        field_errors = [
+            {
+                "field": ".".join(map(str, err.get("loc", ()))) or "unknown",
+                "message": err.get("msg", "invalid"),
+            }
+            for err in error_data["detail"]
+        ]
+        return UCPValidationError(
+            f"Invalid request: {len(field_errors)} field(s) have errors",
+            field_errors=field_errors,
+            status_code=status_code,
+        )
+    return UCPValidationError(message, status_code=status_code)
+
+
+def _not_found_error(
+    status_code: int, message: str, error_data: dict[str, Any]
+) -> UCPError:
+    """Build a not-found error."""
+    return UCPNotFoundError(message, status_code=status_code)
+
+
+def _bad_request_error(
+    status_code: int, message: str, error_data: dict[str, Any]
+) -> UCPError:
+    """Build a bad-request error."""
+    return UCPRequestError(f"Bad request: {message}", status_code=status_code)
+
+
+def _generic_error(
+    status_code: int, message: str, error_data: dict[str, Any]
+) -> UCPError:
+    """Build a generic UCP error carrying the raw error payload."""
+    return UCPError(message, status_code=status_code, details=error_data)
+
+
+_ERROR_FACTORIES: dict[int, Callable[[int, str, dict[str, Any]], UCPError]] = {
+    422: _validation_error,
+    404: _not_found_error,
+    400: _bad_request_error,
+}
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _noop_log(message: str, data: Any = None) -> None:
+    """Discard a log message (used when verbose mode is off)."""
+
+
+if orjson is not None:
+
+    def _format_log_data(data: Any) -> str:
+        """Format log data as indented JSON using orjson."""
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=option, default=str).decode()
+
+else:
+
+    def _format_log_data(data: Any) -> str:
+        """Format log data as indented JSON using the standard library."""
+        return json.dumps(data, indent=2, default=str)
 
 
 class UCPClientConfig(BaseModel):
@@ -72,11 +203,27 @@ class UCPClient:
             verbose=verbose,
         )
         self._http_client: httpx.AsyncClient | None = None
+        self._static_headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "UCP-Agent": f'{agent_name}; version="{UCP_VERSION}"',
+            "Request-Signature": "dummy-signature",
+        }
         self._cached_profile: UcpDiscoveryProfile | None = None
         self._agent_capabilities = agent_capabilities or []
+        self._agent_capability_set = frozenset(
+            (cap.get("name"), cap.get("version"))
+            for cap in self._agent_capabilities
+        )
+        self._common_capabilities: (
+            tuple[UcpDiscoveryProfile, list[UcpCapability]] | None
+        ) = None
 
         if verbose:
             logging.getLogger(__name__).setLevel(logging.DEBUG)
+        else:
+            # Shadow the method so log calls cost only the call itself
+            self._log = _noop_log
 
     # -------------------------------------------------------------------------
     # Properties
@@ -89,9 +236,19 @@ class UCPClient:
 
     @property
     def http_client(self) -> httpx.AsyncClient:
-        """Lazy initialization of HTTP client."""
+        """Lazy initialization of HTTP client.
+
+        The client is bound to the merchant URL, so requests use relative
+        paths over a pooled set of keep-alive connections. HTTP/2 is enabled
+        when the ``h2`` package is installed.
+        """
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=self.config.timeout)
+            self._http_client = httpx.AsyncClient(
+                base_url=self.config.merchant_url,
+                timeout=self.config.timeout,
+                limits=DEFAULT_LIMITS,
+                http2=_HTTP2_AVAILABLE,
+            )
         return self._http_client
 
     # -------------------------------------------------------------------------
@@ -107,6 +264,7 @@ class UCPClient:
     def clear_profile_cache(self) -> None:
         """Clear the cached merchant profile."""
         self._cached_profile = None
+        self._common_capabilities = None
 
     # -------------------------------------------------------------------------
     # Discovery
@@ -133,9 +291,8 @@ class UCPClient:
             self._log("Using cached profile")
             return self._cached_profile
 
-        url = f"{self.config.merchant_url}/.well-known/ucp"
-        data = await self._get(url)
-        profile = UcpDiscoveryProfile.model_validate(data)
+        url = "/.well-known/ucp"
+        profile = await self._get(url, UcpDiscoveryProfile)
 
         if validate_version:
             self._validate_version(profile)
@@ -167,16 +324,26 @@ class UCPClient:
         idempotency_key: str | None = None,
     ) -> CheckoutResponse:
         """Create a new checkout session."""
-        url = f"{self.config.merchant_url}/checkout-sessions"
-        payload = request.model_dump(mode="json", by_alias=True, exclude_none=True)
-        data = await self._post(url, payload, idempotency_key)
-        return CheckoutResponse.model_validate(data)
+        url = "/checkout-sessions"
+        return await self._post(url, request, idempotency_key, CheckoutResponse)
 
     async def get_checkout(self, checkout_id: str) -> CheckoutResponse:
         """Get checkout session by ID."""
-        url = f"{self.config.merchant_url}/checkout-sessions/{checkout_id}"
-        data = await self._get(url)
-        return CheckoutResponse.model_validate(data)
+        url = f"/checkout-sessions/{checkout_id}"
+        return await self._get(url, CheckoutResponse)
+
+    async def get_checkouts(self, checkout_ids: list[str]) -> list[CheckoutResponse]:
+        """Get several checkout sessions concurrently.
+
+        Args:
+            checkout_ids: IDs of the checkout sessions to fetch
+
+        Returns:
+            The checkout sessions, in the same order as ``checkout_ids``
+        """
+        return await asyncio.gather(
+            *(self.get_checkout(checkout_id) for checkout_id in checkout_ids)
+        )
 
     async def update_checkout(
         self,
@@ -185,10 +352,8 @@ class UCPClient:
         idempotency_key: str | None = None,
     ) -> CheckoutResponse:
         """Update an existing checkout session."""
-        url = f"{self.config.merchant_url}/checkout-sessions/{checkout_id}"
-        payload = request.model_dump(mode="json", by_alias=True, exclude_none=True)
-        data = await self._put(url, payload, idempotency_key)
-        return CheckoutResponse.model_validate(data)
+        url = f"/checkout-sessions/{checkout_id}"
+        return await self._put(url, request, idempotency_key, CheckoutResponse)
 
     async def complete_checkout(
         self,
@@ -198,13 +363,12 @@ class UCPClient:
         idempotency_key: str | None = None,
     ) -> CheckoutResponse:
         """Complete a checkout session with payment."""
-        url = f"{self.config.merchant_url}/checkout-sessions/{checkout_id}/complete"
+        url = f"/checkout-sessions/{checkout_id}/complete"
         payload = {
             "payment_data": payment_data,
             "risk_signals": risk_signals or {},
         }
-        data = await self._post(url, payload, idempotency_key)
-        return CheckoutResponse.model_validate(data)
+        return await self._post(url, payload, idempotency_key, CheckoutResponse)
 
     async def cancel_checkout(
         self,
@@ -212,9 +376,8 @@ class UCPClient:
         idempotency_key: str | None = None,
     ) -> CheckoutResponse:
         """Cancel a checkout session."""
-        url = f"{self.config.merchant_url}/checkout-sessions/{checkout_id}/cancel"
-        data = await self._post(url, None, idempotency_key)
-        return CheckoutResponse.model_validate(data)
+        url = f"/checkout-sessions/{checkout_id}/cancel"
+        return await self._post(url, None, idempotency_key, CheckoutResponse)
 
     # -------------------------------------------------------------------------
     # Order Operations
@@ -222,49 +385,59 @@ class UCPClient:
 
     async def get_order(self, order_id: str) -> dict[str, Any]:
         """Get order by ID."""
-        url = f"{self.config.merchant_url}/orders/{order_id}"
+        url = f"/orders/{order_id}"
         return await self._get(url)
 
     # -------------------------------------------------------------------------
     # Private: HTTP Methods
     # -------------------------------------------------------------------------
 
-    async def _get(self, url: str) -> dict[str, Any]:
+    async def _get(
+        self,
+        url: str,
+        response_model: type[BaseModel] | None = None,
+    ) -> Any:
         """Execute GET request."""
         self._log(f"GET {url}")
         response = await self.http_client.get(url, headers=self._get_headers())
-        data = self._handle_response(response)
+        data = self._handle_response(response, response_model)
         self._log("Response", data)
         return data
 
     async def _post(
         self,
         url: str,
-        payload: dict[str, Any] | None,
+        payload: dict[str, Any] | BaseModel | None,
         idempotency_key: str | None = None,
-    ) -> dict[str, Any]:
+        response_model: type[BaseModel] | None = None,
+    ) -> Any:
         """Execute POST request."""
         self._log(f"POST {url}")
         if payload:
             self._log("Request payload", payload)
         headers = self._get_headers(idempotency_key)
-        response = await self.http_client.post(url, json=payload, headers=headers)
-        data = self._handle_response(response)
+        response = await self.http_client.post(
+            url, content=_encode_payload(payload), headers=headers
+        )
+        data = self._handle_response(response, response_model)
         self._log("Response", data)
         return data
 
     async def _put(
         self,
         url: str,
-        payload: dict[str, Any],
+        payload: dict[str, Any] | BaseModel,
         idempotency_key: str | None = None,
-    ) -> dict[str, Any]:
+        response_model: type[BaseModel] | None = None,
+    ) -> Any:
         """Execute PUT request."""
         self._log(f"PUT {url}")
         self._log("Request payload", payload)
         headers = self._get_headers(idempotency_key)
-        response = await self.http_client.put(url, json=payload, headers=headers)
-        data = self._handle_response(response)
+        response = await self.http_client.put(
+            url, content=_encode_payload(payload), headers=headers
+        )
+        data = self._handle_response(response, response_model)
         self._log("Response", data)
         return data
 
@@ -274,19 +447,25 @@ class UCPClient:
 
     def _get_headers(self, idempotency_key: str | None = None) -> dict[str, str]:
         """Get standard UCP headers."""
-        return {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "UCP-Agent": f'{self.config.agent_name}; version="{UCP_VERSION}"',
-            "Request-Signature": "dummy-signature",
-            "Request-Id": str(uuid.uuid4()),
-            "Idempotency-Key": idempotency_key or str(uuid.uuid4()),
-        }
+        headers = self._static_headers.copy()
+        headers["Request-Id"] = uuid.uuid4().hex
+        headers["Idempotency-Key"] = idempotency_key or uuid.uuid4().hex
+        return headers
 
-    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
-        """Handle HTTP response and raise appropriate errors."""
-        if response.is_success:
-            return response.json()
+    def _handle_response(
+        self,
+        response: httpx.Response,
+        response_model: type[BaseModel] | None = None,
+    ) -> Any:
+        """Handle HTTP response and raise appropriate errors.
+
+        With a ``response_model``, successful bodies are validated straight
+        from the raw JSON bytes, without building an intermediate dict.
+        """
+        if 200 <= response.status_code < 300:
+            if response_model is not None:
+                return response_model.model_validate_json(response.content)
+            return _loads(response.content)
 
         error = self._parse_error(response)
         self._log(f"Error: {error}")
@@ -297,7 +476,7 @@ class UCPClient:
         status_code = response.status_code
 
         try:
-            error_data = response.json()
+            error_data = _loads(response.content)
         except Exception:
             error_data = {"message": response.text or "Unknown error"}
 
@@ -307,71 +486,54 @@ class UCPClient:
             or str(error_data)
         )
 
-        if status_code == 422:
-            return self._parse_validation_error(error_data, message)
-        if status_code == 404:
-            return UCPNotFoundError(message, status_code=status_code)
-        if status_code == 400:
-            return UCPRequestError(f"Bad request: {message}", status_code=status_code)
-
-        return UCPError(message, status_code=status_code, details=error_data)
-
-    def _parse_validation_error(
-        self, error_data: dict, message: str
-    ) -> UCPValidationError:
-        """Parse validation error details."""
-        if "detail" in error_data and isinstance(error_data["detail"], list):
-            field_errors = [
-                {
-                    "field": ".".join(str(loc) for loc in err.get("loc", [])) or "unknown",
-                    "message": err.get("msg", "invalid"),
-                }
-                for err in error_data["detail"]
-            ]
-            return UCPValidationError(
-                f"Invalid request: {len(field_errors)} field(s) have errors",
-                field_errors=field_errors,
-            )
-        return UCPValidationError(message)
+        factory = _ERROR_FACTORIES.get(status_code, _generic_error)
+        return factory(status_code, message, error_data)
 
     def _validate_version(self, merchant_profile: UcpDiscoveryProfile) -> None:
         """Validate version compatibility."""
         merchant_version_str = merchant_profile.ucp.version
 
         try:
-            merchant_version = datetime.strptime(merchant_version_str, "%Y-%m-%d").date()
-            agent_version = datetime.strptime(UCP_VERSION, "%Y-%m-%d").date()
+            merchant_version = _parse_version(merchant_version_str)
         except ValueError as e:
             logger.warning(f"Could not parse UCP version: {e}")
             return
 
-        if agent_version > merchant_version:
+        if _AGENT_VERSION > merchant_version:
             raise UCPVersionError(UCP_VERSION, merchant_version_str)
 
     def _get_common_capabilities(
         self, merchant_profile: UcpDiscoveryProfile
     ) -> list[UcpCapability]:
-        """Find common capabilities between agent and merchant."""
-        agent_capability_set = {
-            (cap.get("name"), cap.get("version"))
-            for cap in self._agent_capabilities
-        }
+        """Find common capabilities between agent and merchant.
+
+        The result is memoized for the last profile seen, which is normally
+        the cached discovery profile.
+        """
+        cached = self._common_capabilities
+        if cached is not None and cached[0] is merchant_profile:
+            return cached[1]
 
+        agent_capability_set = self._agent_capability_set
         merchant_capabilities = merchant_profile.ucp.capabilities or []
-        return [
+        common = [
             cap
             for cap in merchant_capabilities
-            if (
-                cap.name,
-                cap.version.root if hasattr(cap.version, "root") else cap.version,
-            )
-            in agent_capability_set
+            if (cap.name, _capability_version(cap.version)) in agent_capability_set
         ]
+        self._common_capabilities = (merchant_profile, common)
+        return common
 
     def _log(self, message: str, data: Any = None) -> None:
-        """Log message if verbose mode is enabled."""
-        if self.verbose:
-            if data:
-                logger.debug(f"[UCP] {message}: {json.dumps(data, indent=2, default=str)}")
-            else:
-                logger.debug(f"[UCP] {message}")
+        """Log message if verbose mode is enabled.
+
+        Non-verbose clients replace this with a no-op in ``__init__``.
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        if isinstance(data, BaseModel):
+            data = data.model_dump(mode="json", by_alias=True, exclude_none=True)
+        if data:
+            logger.debug(f"[UCP] {message}: {_format_log_data(data)}")
+        else:
+            logger.debug(f"[UCP] {message}")
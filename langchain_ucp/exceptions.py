@@ -3,8 +3,25 @@
 from typing import Any
 
 
+def _rebuild_error(
+    cls: type["UCPError"], args: tuple[Any, ...], state: dict[str, Any]
+) -> "UCPError":
+    """Recreate a pickled UCP error without re-running ``__init__``."""
+    error = cls.__new__(cls, *args)
+    error.args = args
+    for name, value in state.items():
+        setattr(error, name, value)
+    return error
+
+
 class UCPError(Exception):
-    """Base exception for UCP errors."""
+    """Base exception for UCP errors.
+
+    Attributes live in ``__slots__`` to keep error objects small; subclasses
+    declare only the slots they add.
+    """
+
+    __slots__ = ("message", "status_code", "details", "__weakref__")
 
     def __init__(
         self,
@@ -17,10 +34,23 @@ class UCPError(Exception):
         self.details = details
         super().__init__(message)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Slot values are not in __dict__, so BaseException's default
+        # pickling would drop them
+        state = {
+            name: getattr(self, name)
+            for klass in type(self).__mro__
+            for name in getattr(klass, "__slots__", ())
+            if name != "__weakref__" and hasattr(self, name)
+        }
+        return _rebuild_error, (type(self), self.args, state)
+
 
 class UCPVersionError(UCPError):
     """Raised when UCP version is incompatible."""
 
+    __slots__ = ("client_version", "merchant_version")
+
     def __init__(self, client_version: str, merchant_version: str):
         self.client_version = client_version
         self.merchant_version = merchant_version
@@ -33,13 +63,16 @@ class UCPVersionError(UCPError):
 class UCPValidationError(UCPError):
     """Raised when server returns a validation error."""
 
+    __slots__ = ("field_errors",)
+
     def __init__(
         self,
         message: str,
         field_errors: list[dict[str, Any]] | None = None,
+        status_code: int | None = None,
     ):
         self.field_errors = field_errors or []
-        super().__init__(message)
+        super().__init__(message, status_code=status_code)
 
     def __str__(self) -> str:
         if self.field_errors:
@@ -54,10 +87,10 @@ class UCPValidationError(UCPError):
 class UCPNotFoundError(UCPError):
     """Raised when a resource is not found."""
 
-    pass
+    __slots__ = ()
 
 
 class UCPRequestError(UCPError):
     """Raised when request fails."""
 
-    pass
+    __slots__ = ()
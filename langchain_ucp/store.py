@@ -1,23 +1,36 @@
 """UCP Store for managing checkout sessions and product catalog."""
 
+from __future__ import annotations
+
 import logging
-from typing import Any
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from langchain_ucp.exceptions import UCPError
 
-from ucp_sdk.models.schemas.shopping.checkout_create_req import CheckoutCreateRequest
-from ucp_sdk.models.schemas.shopping.checkout_resp import CheckoutResponse
-from ucp_sdk.models.schemas.shopping.checkout_update_req import CheckoutUpdateRequest
-from ucp_sdk.models.schemas.shopping.payment_create_req import PaymentCreateRequest
-from ucp_sdk.models.schemas.shopping.payment_update_req import PaymentUpdateRequest
-from ucp_sdk.models.schemas.shopping.types.buyer import Buyer
-from ucp_sdk.models.schemas.shopping.types.item_create_req import ItemCreateRequest
-from ucp_sdk.models.schemas.shopping.types.item_update_req import ItemUpdateRequest
-from ucp_sdk.models.schemas.shopping.types.line_item_create_req import LineItemCreateRequest
-from ucp_sdk.models.schemas.shopping.types.line_item_update_req import LineItemUpdateRequest
+# The UCP SDK schemas (and the HTTP client) are imported where requests are
+# built, so importing Product for catalog work does not pull them in.
+if TYPE_CHECKING:
+    from ucp_sdk.models.schemas.shopping.checkout_resp import CheckoutResponse
+    from ucp_sdk.models.schemas.shopping.checkout_update_req import (
+        CheckoutUpdateRequest,
+    )
+    from ucp_sdk.models.schemas.shopping.types.buyer import Buyer
+    from ucp_sdk.models.schemas.shopping.types.line_item_create_req import (
+        LineItemCreateRequest,
+    )
+    from ucp_sdk.models.schemas.shopping.types.line_item_update_req import (
+        LineItemUpdateRequest,
+    )
 
-from langchain_ucp.client import UCPClient
+    from langchain_ucp.client import UCPClient
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +38,17 @@ logger = logging.getLogger(__name__)
 DEFAULT_CURRENCY = "USD"
 DEFAULT_PAYMENT_HANDLER = "mock_payment_handler"
 DEFAULT_PAYMENT_TOKEN = "success_token"
+# Seconds a server checkout response is reused before mutations refetch it.
+CHECKOUT_CACHE_MAX_AGE = 5.0
+# Statuses that mean an optimistic update was based on an outdated checkout.
+# 422 is deliberately absent: it reports a genuinely invalid request.
+STALE_CHECKOUT_STATUS_CODES = frozenset({409, 412})
+# Length of the substrings indexed for catalog search; shorter keywords scan.
+SEARCH_NGRAM_SIZE = 3
+# Number of distinct normalized queries whose results are memoized.
+SEARCH_CACHE_SIZE = 256
+# Catalogs larger than this build their search index in a background thread.
+PREWARM_MIN_PRODUCTS = 1000
 
 
 # -----------------------------------------------------------------------------
@@ -36,8 +60,11 @@ class Product(BaseModel):
     """Product model for agent-side catalog discovery.
 
     Note: Temporary solution until UCP product discovery is implemented.
+    Products are immutable (and hashable) so catalogs can be shared freely.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     description: str | None = None
@@ -52,6 +79,18 @@ class ProductSearchResult(BaseModel):
     total: int
 
 
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _get_field(obj: Any, name: str) -> Any:
+    """Read a field from a model, or from a dict for untyped extension data."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
 # -----------------------------------------------------------------------------
 # Store
 # -----------------------------------------------------------------------------
@@ -65,6 +104,7 @@ class UCPStore:
         client: UCPClient,
         products: list[Product],
         verbose: bool = False,
+        legacy_fulfillment: bool = False,
     ):
         """Initialize UCP Store.
 
@@ -72,12 +112,17 @@ class UCPStore:
             client: UCP HTTP client instance
             products: Product catalog
             verbose: Enable verbose logging
+            legacy_fulfillment: Select the shipping destination in a separate
+                update, for servers that reject it alongside the address
         """
         self.client = client
+        self.legacy_fulfillment = legacy_fulfillment
         self.checkout_id: str | None = None
         self._checkout_cache: CheckoutResponse | None = None
+        self._checkout_cache_ts: float = 0.0
         self.verbose = verbose
         self.products: dict[str, Product] = {p.id: p for p in products}
+        self._build_search_index()
 
         if verbose:
             logging.getLogger(__name__).setLevel(logging.DEBUG)
@@ -86,21 +131,44 @@ class UCPStore:
     # Product Operations
     # -------------------------------------------------------------------------
 
-    def search_products(self, query: str) -> ProductSearchResult:
-        """Search the product catalog."""
-        keywords = query.lower().split()
-        matching = [
-            product
-            for product in self.products.values()
-            if self._matches_keywords(product, keywords)
-        ]
+    def search_products(
+        self,
+        query: str,
+        fallback_to_all: bool = True,
+    ) -> ProductSearchResult:
+        """Search the product catalog.
+
+        A product matches when any query keyword is a substring of its
+        lowercased title or id. Matches keep catalog order; with
+        ``fallback_to_all`` the whole catalog is returned when nothing matches.
+        """
+        normalized = " ".join(sorted(set(query.lower().split())))
+        matching = [self._catalog[i] for i in self._search_positions(normalized)]
+
+        if not matching and fallback_to_all:
+            matching = list(self._catalog)
 
         return ProductSearchResult(
-            products=matching or list(self.products.values()),
+            products=matching,
             query=query,
-            total=len(matching) if matching else len(self.products),
+            total=len(matching),
         )
 
+    def prewarm(self) -> Future[None]:
+        """Build the search index in a background thread.
+
+        Called automatically for catalogs over ``PREWARM_MIN_PRODUCTS``.
+        Searches issued before the index is ready scan the catalog instead,
+        with the same results. Returns a future that resolves once built.
+        """
+        if self._index_future is None:
+            executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="ucp-search-index"
+            )
+            self._index_future = executor.submit(self._build_ngram_index)
+            executor.shutdown(wait=False)
+        return self._index_future
+
     def get_product(self, product_id: str) -> Product | None:
         """Get product by ID."""
         return self.products.get(product_id)
@@ -115,29 +183,43 @@ class UCPStore:
         quantity: int = 1,
     ) -> CheckoutResponse:
         """Add a product to the checkout session."""
-        product = self._get_product_or_raise(product_id)
+        return await self.add_many_to_checkout([(product_id, quantity)])
+
+    async def add_many_to_checkout(
+        self,
+        items: list[tuple[str, int]],
+    ) -> CheckoutResponse:
+        """Add several products to the checkout session in one update.
+
+        Quantities for repeated product IDs are summed, so the whole batch
+        costs a single create or update request.
+        """
+        additions: dict[str, int] = {}
+        for product_id, quantity in items:
+            self._get_product_or_raise(product_id)
+            additions[product_id] = additions.get(product_id, 0) + quantity
+
+        if not additions:
+            raise ValueError("No products to add")
 
         if self.checkout_id:
-            return await self._add_to_existing_checkout(product_id, quantity)
+            return await self._add_to_existing_checkout(additions)
 
-        line_item = LineItemCreateRequest(
-            item=ItemCreateRequest(id=product.id),
-            quantity=quantity,
+        return await self._create_new_checkout(
+            [self._build_line_item(pid, qty) for pid, qty in additions.items()]
         )
-        return await self._create_new_checkout([line_item])
 
     async def remove_from_checkout(self, product_id: str) -> CheckoutResponse:
         """Remove a product from the checkout."""
         self._ensure_active_checkout()
 
-        existing = await self.client.get_checkout(self.checkout_id)
-        updated_items = [
-            self._to_line_item_update(item)
-            for item in (existing.line_items or [])
-            if item.item.id != product_id
-        ]
-
-        return await self._update_checkout_items(existing, updated_items)
+        return await self._mutate_checkout(
+            lambda existing: [
+                self._to_line_item_update(item)
+                for item in (existing.line_items or [])
+                if item.item.id != product_id
+            ]
+        )
 
     async def update_checkout_quantity(
         self,
@@ -150,22 +232,29 @@ class UCPStore:
 
         self._ensure_active_checkout()
 
-        existing = await self.client.get_checkout(self.checkout_id)
-        updated_items = [
-            self._to_line_item_update(item, quantity if item.item.id == product_id else None)
-            for item in (existing.line_items or [])
-        ]
+        return await self._mutate_checkout(
+            lambda existing: [
+                self._to_line_item_update(
+                    item, quantity if item.item.id == product_id else None
+                )
+                for item in (existing.line_items or [])
+            ]
+        )
 
-        return await self._update_checkout_items(existing, updated_items)
+    async def get_checkout(
+        self,
+        force_refresh: bool = False,
+    ) -> CheckoutResponse | None:
+        """Get the current checkout session.
 
-    async def get_checkout(self) -> CheckoutResponse | None:
-        """Get the current checkout session."""
+        Reuses the last server response for up to ``CHECKOUT_CACHE_MAX_AGE``
+        seconds; pass ``force_refresh=True`` to always refetch.
+        """
         if not self.checkout_id:
             return None
 
-        checkout = await self.client.get_checkout(self.checkout_id)
-        self._checkout_cache = checkout
-        return checkout
+        max_age = 0.0 if force_refresh else CHECKOUT_CACHE_MAX_AGE
+        return await self._get_checkout_cached(max_age)
 
     # -------------------------------------------------------------------------
     # Customer & Fulfillment
@@ -186,13 +275,16 @@ class UCPStore:
         """Update customer details and complete the fulfillment flow.
 
         Handles the full flow:
-        1. Add shipping address
-        2. Select destination
+        1. Add shipping address (and select it as the destination)
+        2. Select destination, if the server did not generate options yet
         3. Select shipping option
+
+        Unless ``legacy_fulfillment`` is set, step 1 also selects the new
+        destination, so servers that accept it skip step 2's round-trip.
         """
         self._ensure_active_checkout()
 
-        existing = await self.client.get_checkout(self.checkout_id)
+        existing = await self._get_checkout_cached()
         line_items = self._build_line_items_for_update(existing)
         buyer = self._build_buyer(email, first_name, last_name)
         address = self._build_address(
@@ -201,15 +293,19 @@ class UCPStore:
         )
 
         # Step 1: Add shipping address
-        checkout = await self._add_shipping_address(existing, line_items, buyer, address)
+        checkout = await self._add_shipping_address(
+            existing, line_items, buyer, address,
+            select_destination=not self.legacy_fulfillment,
+        )
 
         # Step 2: Select destination
-        checkout = await self._select_destination(checkout, line_items, buyer)
+        if self.legacy_fulfillment or not self._get_first_option_id(checkout):
+            checkout = await self._select_destination(checkout, line_items, buyer)
 
         # Step 3: Select shipping option
         checkout = await self._select_shipping_option(checkout, line_items, buyer)
 
-        self._checkout_cache = checkout
+        self._cache_checkout(checkout)
         return checkout
 
     # -------------------------------------------------------------------------
@@ -226,7 +322,7 @@ class UCPStore:
         if missing:
             return f"Please provide: {', '.join(missing)}"
 
-        self._checkout_cache = checkout
+        self._cache_checkout(checkout)
         return checkout
 
     async def complete_checkout(
@@ -280,16 +376,69 @@ class UCPStore:
         """Clear the current checkout session."""
         self.checkout_id = None
         self._checkout_cache = None
+        self._checkout_cache_ts = 0.0
 
     # -------------------------------------------------------------------------
     # Private: Checkout Helpers
     # -------------------------------------------------------------------------
 
+    async def _get_checkout_cached(
+        self,
+        max_age_s: float = CHECKOUT_CACHE_MAX_AGE,
+    ) -> CheckoutResponse:
+        """Get the active checkout, reusing the cached response while fresh."""
+        cached = self._checkout_cache
+        if (
+            cached is not None
+            and cached.id == self.checkout_id
+            and time.monotonic() - self._checkout_cache_ts < max_age_s
+        ):
+            return cached
+
+        checkout = await self.client.get_checkout(self.checkout_id)
+        self._cache_checkout(checkout)
+        return checkout
+
+    async def _mutate_checkout(
+        self,
+        build_items: Callable[[CheckoutResponse], list[LineItemUpdateRequest]],
+    ) -> CheckoutResponse:
+        """Apply a line-item change optimistically on the cached checkout.
+
+        The store is the only writer of its checkout, so any cached response
+        is used without a fresh GET. If the server rejects the update as
+        stale (``STALE_CHECKOUT_STATUS_CODES``), the change is recomputed
+        once against a refetched checkout.
+        """
+        optimistic = self._checkout_cache is not None
+        existing = await self._get_checkout_cached(max_age_s=float("inf"))
+        try:
+            return await self._update_checkout_items(existing, build_items(existing))
+        except UCPError as e:
+            if not optimistic or e.status_code not in STALE_CHECKOUT_STATUS_CODES:
+                raise
+            self._log("Cached checkout is stale (%s), refetching", e.status_code)
+
+        existing = await self._get_checkout_cached(max_age_s=0.0)
+        return await self._update_checkout_items(existing, build_items(existing))
+
+    def _cache_checkout(self, checkout: CheckoutResponse) -> None:
+        """Remember the latest server response for the active checkout."""
+        self._checkout_cache = checkout
+        self._checkout_cache_ts = time.monotonic()
+
     async def _create_new_checkout(
         self,
         line_items: list[LineItemCreateRequest],
     ) -> CheckoutResponse:
         """Create a new checkout session."""
+        from ucp_sdk.models.schemas.shopping.checkout_create_req import (
+            CheckoutCreateRequest,
+        )
+        from ucp_sdk.models.schemas.shopping.payment_create_req import (
+            PaymentCreateRequest,
+        )
+
         create_req = CheckoutCreateRequest(
             currency=DEFAULT_CURRENCY,
             line_items=line_items,
@@ -297,42 +446,36 @@ class UCPStore:
         )
         checkout = await self.client.create_checkout(create_req)
         self.checkout_id = checkout.id
-        self._checkout_cache = checkout
+        self._cache_checkout(checkout)
         return checkout
 
     async def _add_to_existing_checkout(
         self,
-        product_id: str,
-        quantity: int,
+        additions: dict[str, int],
     ) -> CheckoutResponse:
-        """Add item to existing checkout."""
+        """Add items to existing checkout."""
         try:
-            existing = await self.client.get_checkout(self.checkout_id)
-            updated_items = self._merge_item_into_checkout(
-                existing, product_id, quantity
+            return await self._mutate_checkout(
+                lambda existing: self._merge_items_into_checkout(existing, additions)
             )
-            return await self._update_checkout_items(existing, updated_items)
         except Exception:
-            line_item = LineItemCreateRequest(
-                item=ItemCreateRequest(id=product_id),
-                quantity=quantity,
+            return await self._create_new_checkout(
+                [self._build_line_item(pid, qty) for pid, qty in additions.items()]
             )
-            return await self._create_new_checkout([line_item])
 
     async def _update_checkout_items(
         self,
         existing: CheckoutResponse,
         line_items: list[LineItemUpdateRequest],
     ) -> CheckoutResponse:
-        """Update checkout with new line items."""
-        update_req = CheckoutUpdateRequest(
-            id=self.checkout_id,
-            currency=existing.currency,
-            line_items=line_items,
-            payment=PaymentUpdateRequest(instruments=[]),
-        )
+        """Update checkout with new line items, skipping no-op updates."""
+        if self._line_items_unchanged(existing, line_items):
+            self._log("Line items unchanged, skipping update")
+            return existing
+
+        update_req = self._build_update_request(existing.currency, line_items)
         checkout = await self.client.update_checkout(self.checkout_id, update_req)
-        self._checkout_cache = checkout
+        self._cache_checkout(checkout)
         return checkout
 
     # -------------------------------------------------------------------------
@@ -345,23 +488,20 @@ class UCPStore:
         line_items: list[LineItemUpdateRequest],
         buyer: Buyer | None,
         address: dict[str, Any],
+        select_destination: bool = False,
     ) -> CheckoutResponse:
-        """Step 1: Add shipping address."""
-        fulfillment = {
-            "methods": [{"type": "shipping", "destinations": [address]}]
-        }
-
-        update_req = CheckoutUpdateRequest(
-            id=self.checkout_id,
-            currency=existing.currency,
-            line_items=line_items,
-            payment=PaymentUpdateRequest(instruments=[]),
-            buyer=buyer,
-            fulfillment=fulfillment,
+        """Step 1: Add shipping address, optionally selecting it as well."""
+        method: dict[str, Any] = {"type": "shipping", "destinations": [address]}
+        if select_destination:
+            method["selected_destination_id"] = address["id"]
+        fulfillment = {"methods": [method]}
+
+        update_req = self._build_update_request(
+            existing.currency, line_items, buyer, fulfillment
         )
 
         checkout = await self.client.update_checkout(self.checkout_id, update_req)
-        self._log(f"Step 1: Added shipping address, status={checkout.status}")
+        self._log("Step 1: Added shipping address, status=%s", checkout.status)
         return checkout
 
     async def _select_destination(
@@ -376,22 +516,17 @@ class UCPStore:
             self._log("Step 2: No destinations found")
             return checkout
 
-        self._log(f"Step 2: Selecting destination {dest_id}")
+        self._log("Step 2: Selecting destination %s", dest_id)
         fulfillment = {
             "methods": [{"type": "shipping", "selected_destination_id": dest_id}]
         }
 
-        update_req = CheckoutUpdateRequest(
-            id=self.checkout_id,
-            currency=checkout.currency,
-            line_items=line_items,
-            payment=PaymentUpdateRequest(instruments=[]),
-            buyer=buyer,
-            fulfillment=fulfillment,
+        update_req = self._build_update_request(
+            checkout.currency, line_items, buyer, fulfillment
         )
 
         checkout = await self.client.update_checkout(self.checkout_id, update_req)
-        self._log(f"Step 2: Selected destination, status={checkout.status}")
+        self._log("Step 2: Selected destination, status=%s", checkout.status)
         return checkout
 
     async def _select_shipping_option(
@@ -408,7 +543,7 @@ class UCPStore:
             self._log("Step 3: No shipping options available")
             return checkout
 
-        self._log(f"Step 3: Selecting option {option_id}")
+        self._log("Step 3: Selecting option %s", option_id)
         fulfillment = {
             "methods": [
                 {
@@ -419,17 +554,12 @@ class UCPStore:
             ]
         }
 
-        update_req = CheckoutUpdateRequest(
-            id=self.checkout_id,
-            currency=checkout.currency,
-            line_items=line_items,
-            payment=PaymentUpdateRequest(instruments=[]),
-            buyer=buyer,
-            fulfillment=fulfillment,
+        update_req = self._build_update_request(
+            checkout.currency, line_items, buyer, fulfillment
         )
 
         checkout = await self.client.update_checkout(self.checkout_id, update_req)
-        self._log(f"Step 3: Selected option, status={checkout.status}")
+        self._log("Step 3: Selected option, status=%s", checkout.status)
         return checkout
 
     # -------------------------------------------------------------------------
@@ -438,26 +568,25 @@ class UCPStore:
 
     def _get_destination_id(self, checkout: CheckoutResponse) -> str | None:
         """Extract destination ID from checkout."""
-        data = checkout.model_dump(mode="json")
-        methods = data.get("fulfillment", {}).get("methods", [])
-        if methods:
-            destinations = methods[0].get("destinations", [])
-            if destinations:
-                return destinations[0].get("id")
+        destinations = _get_field(self._get_first_method(checkout), "destinations")
+        if destinations:
+            return _get_field(destinations[0], "id")
         return None
 
     def _get_first_option_id(self, checkout: CheckoutResponse) -> str | None:
         """Extract first shipping option ID from checkout."""
-        data = checkout.model_dump(mode="json")
-        methods = data.get("fulfillment", {}).get("methods", [])
-        if methods:
-            groups = methods[0].get("groups", [])
-            if groups:
-                options = groups[0].get("options", [])
-                if options:
-                    return options[0].get("id")
+        groups = _get_field(self._get_first_method(checkout), "groups")
+        if groups:
+            options = _get_field(groups[0], "options")
+            if options:
+                return _get_field(options[0], "id")
         return None
 
+    def _get_first_method(self, checkout: CheckoutResponse) -> Any:
+        """Get the first fulfillment method without dumping the checkout."""
+        methods = _get_field(_get_field(checkout, "fulfillment"), "methods")
+        return methods[0] if methods else None
+
     # -------------------------------------------------------------------------
     # Private: Builders
     # -------------------------------------------------------------------------
@@ -479,6 +608,8 @@ class UCPStore:
         last_name: str,
     ) -> Buyer | None:
         """Build buyer object."""
+        from ucp_sdk.models.schemas.shopping.types.buyer import Buyer
+
         if email:
             return Buyer(email=email, first_name=first_name, last_name=last_name)
         return None
@@ -494,9 +625,18 @@ class UCPStore:
         address_country: str,
         extended_address: str | None,
     ) -> dict[str, Any]:
-        """Build shipping address dict."""
+        """Build shipping address dict.
+
+        The destination ID is derived from the address itself, so retrying
+        the same details reuses the same destination on the server.
+        """
+        fingerprint = "|".join((
+            first_name, last_name, street_address, extended_address or "",
+            address_locality, address_region, postal_code, address_country,
+        ))
+        digest = blake2b(fingerprint.encode(), digest_size=4).hexdigest()
         address = {
-            "id": f"dest_{uuid4().hex[:8]}",
+            "id": f"dest_{digest}",
             "street_address": street_address,
             "address_locality": address_locality,
             "address_region": address_region,
@@ -509,6 +649,48 @@ class UCPStore:
             address["extended_address"] = extended_address
         return address
 
+    def _build_line_item(
+        self,
+        product_id: str,
+        quantity: int,
+    ) -> LineItemCreateRequest:
+        """Build a line item for a new checkout."""
+        from ucp_sdk.models.schemas.shopping.types.item_create_req import (
+            ItemCreateRequest,
+        )
+        from ucp_sdk.models.schemas.shopping.types.line_item_create_req import (
+            LineItemCreateRequest,
+        )
+
+        return LineItemCreateRequest(
+            item=ItemCreateRequest(id=product_id),
+            quantity=quantity,
+        )
+
+    def _build_update_request(
+        self,
+        currency: str,
+        line_items: list[LineItemUpdateRequest],
+        buyer: Buyer | None = None,
+        fulfillment: dict[str, Any] | None = None,
+    ) -> CheckoutUpdateRequest:
+        """Build an update request for the active checkout."""
+        from ucp_sdk.models.schemas.shopping.checkout_update_req import (
+            CheckoutUpdateRequest,
+        )
+        from ucp_sdk.models.schemas.shopping.payment_update_req import (
+            PaymentUpdateRequest,
+        )
+
+        return CheckoutUpdateRequest(
+            id=self.checkout_id,
+            currency=currency,
+            line_items=line_items,
+            payment=PaymentUpdateRequest(instruments=[]),
+            buyer=buyer,
+            fulfillment=fulfillment,
+        )
+
     def _build_payment_data(
         self,
         handler_id: str,
@@ -535,39 +717,52 @@ class UCPStore:
         override_quantity: int | None = None,
     ) -> LineItemUpdateRequest:
         """Convert line item to update request."""
+        from ucp_sdk.models.schemas.shopping.types.item_update_req import (
+            ItemUpdateRequest,
+        )
+        from ucp_sdk.models.schemas.shopping.types.line_item_update_req import (
+            LineItemUpdateRequest,
+        )
+
         return LineItemUpdateRequest(
             id=item.id,
             item=ItemUpdateRequest(id=item.item.id),
             quantity=override_quantity if override_quantity is not None else item.quantity,
         )
 
-    def _merge_item_into_checkout(
+    def _merge_items_into_checkout(
         self,
         checkout: CheckoutResponse,
-        product_id: str,
-        quantity: int,
+        additions: dict[str, int],
     ) -> list[LineItemUpdateRequest]:
-        """Merge new item into existing checkout items."""
-        existing_items = list(checkout.line_items) if checkout.line_items else []
-        found = False
-        updated_items = []
-
-        for item in existing_items:
-            if item.item.id == product_id:
-                updated_items.append(
-                    self._to_line_item_update(item, item.quantity + quantity)
-                )
-                found = True
-            else:
-                updated_items.append(self._to_line_item_update(item))
-
-        if not found:
-            updated_items.append(
-                LineItemUpdateRequest(
-                    item=ItemUpdateRequest(id=product_id),
-                    quantity=quantity,
-                )
+        """Merge new items (product ID -> quantity) into existing checkout items."""
+        from ucp_sdk.models.schemas.shopping.types.item_update_req import (
+            ItemUpdateRequest,
+        )
+        from ucp_sdk.models.schemas.shopping.types.line_item_update_req import (
+            LineItemUpdateRequest,
+        )
+
+        existing_items = checkout.line_items or []
+        updated_items = [
+            self._to_line_item_update(
+                item,
+                item.quantity + additions[item.item.id]
+                if item.item.id in additions
+                else None,
             )
+            for item in existing_items
+        ]
+
+        present = {item.item.id for item in existing_items}
+        updated_items.extend(
+            LineItemUpdateRequest(
+                item=ItemUpdateRequest(id=product_id),
+                quantity=quantity,
+            )
+            for product_id, quantity in additions.items()
+            if product_id not in present
+        )
 
         return updated_items
 
@@ -587,6 +782,18 @@ class UCPStore:
             raise ValueError(f"Product {product_id} not found in catalog")
         return product
 
+    def _line_items_unchanged(
+        self,
+        checkout: CheckoutResponse,
+        line_items: list[LineItemUpdateRequest],
+    ) -> bool:
+        """Check if line items would leave the checkout as it is."""
+        existing_items = checkout.line_items or []
+        return len(existing_items) == len(line_items) and all(
+            new.id == old.id and new.quantity == old.quantity
+            for old, new in zip(existing_items, line_items)
+        )
+
     def _get_missing_for_payment(self, checkout: CheckoutResponse) -> list[str]:
         """Get list of missing items for payment."""
         missing = []
@@ -596,16 +803,85 @@ class UCPStore:
             missing.append("shipping address")
         return missing
 
-    def _matches_keywords(self, product: Product, keywords: list[str]) -> bool:
-        """Check if product matches search keywords."""
-        searchable = f"{product.title} {product.id}".lower()
-        return any(keyword in searchable for keyword in keywords)
+    # -------------------------------------------------------------------------
+    # Private: Search Index
+    # -------------------------------------------------------------------------
+
+    def _build_search_index(self) -> None:
+        """Prepare catalog search state, indexing large catalogs off-thread."""
+        self._catalog: list[Product] = list(self.products.values())
+        self._searchable: list[str] = [
+            f"{product.title} {product.id}".lower() for product in self._catalog
+        ]
+        self._ngram_index: dict[str, set[int]] | None = None
+        self._index_future: Future[None] | None = None
+
+        # Per instance so the cache dies with the (immutable) catalog.
+        self._search_positions = lru_cache(maxsize=SEARCH_CACHE_SIZE)(
+            self._find_positions
+        )
+
+        if len(self._catalog) > PREWARM_MIN_PRODUCTS:
+            self.prewarm()
+        else:
+            self._build_ngram_index()
+            self._index_future = Future()
+            self._index_future.set_result(None)
+
+    def _build_ngram_index(self) -> None:
+        """Index every n-gram of each product's searchable text.
+
+        Posting lists hold catalog positions, so a keyword's candidates are
+        the intersection of its n-gram postings, confirmed with a substring
+        check. This keeps the original substring semantics exactly.
+        """
+        index: dict[str, set[int]] = {}
+        n = SEARCH_NGRAM_SIZE
+        for position, searchable in enumerate(self._searchable):
+            for start in range(len(searchable) - n + 1):
+                ngram = searchable[start:start + n]
+                postings = index.get(ngram)
+                if postings is None:
+                    index[ngram] = {position}
+                else:
+                    postings.add(position)
+
+        self._ngram_index = index
+
+    def _find_positions(self, normalized_query: str) -> tuple[int, ...]:
+        """Get sorted catalog positions matching any keyword of the query."""
+        hits: set[int] = set()
+        for keyword in normalized_query.split():
+            hits.update(self._keyword_hits(keyword))
+        return tuple(sorted(hits))
+
+    def _keyword_hits(self, keyword: str) -> list[int]:
+        """Get catalog positions whose searchable text contains keyword."""
+        searchable = self._searchable
+        index = self._ngram_index
+        n = SEARCH_NGRAM_SIZE
+        if index is None or len(keyword) < n:
+            return [i for i, text in enumerate(searchable) if keyword in text]
+
+        postings = []
+        for start in range(len(keyword) - n + 1):
+            posting = index.get(keyword[start:start + n])
+            if not posting:
+                return []
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        return [i for i in candidates if keyword in searchable[i]]
 
     # -------------------------------------------------------------------------
     # Private: Logging
     # -------------------------------------------------------------------------
 
-    def _log(self, message: str) -> None:
-        """Log message if verbose mode is enabled."""
+    def _log(self, message: str, *args: Any) -> None:
+        """Log message if verbose mode is enabled.
+
+        Arguments are %-formatted by logging, only when the record is emitted.
+        """
         if self.verbose:
-            logger.debug(f"[UCPStore] {message}")
+            logger.debug("[UCPStore] " + message, *args)
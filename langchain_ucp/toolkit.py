@@ -9,6 +9,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from langchain_ucp.client import UCPClient
 from langchain_ucp.store import Product, UCPStore
 from langchain_ucp.tools import (
+    AddManyToCheckoutTool,
     AddToCheckoutTool,
     CancelCheckoutTool,
     CompleteCheckoutTool,
@@ -76,9 +77,14 @@ class UCPToolkit(BaseModel):
         default=False,
         description="Enable verbose logging",
     )
+    legacy_fulfillment: bool = Field(
+        default=False,
+        description="Select the shipping destination in a separate update",
+    )
 
     _client: UCPClient | None = None
     _store: UCPStore | None = None
+    _tools: list[BaseTool] | None = None
 
     def model_post_init(self, __context) -> None:
         """Initialize client and store after model creation."""
@@ -98,6 +104,7 @@ class UCPToolkit(BaseModel):
             client=self._client,
             products=self.products,
             verbose=self.verbose,
+            legacy_fulfillment=self.legacy_fulfillment,
         )
 
         if self.verbose:
@@ -122,6 +129,7 @@ class UCPToolkit(BaseModel):
                 client=self.client,
                 products=self.products,
                 verbose=self.verbose,
+                legacy_fulfillment=self.legacy_fulfillment,
             )
         return self._store
 
@@ -131,6 +139,7 @@ class UCPToolkit(BaseModel):
         Returns commerce operation tools for:
         - search_shopping_catalog: Search products
         - add_to_checkout: Add items to cart
+        - add_many_to_checkout: Add several items to cart at once
         - remove_from_checkout: Remove items from cart
         - update_checkout: Update item quantities
         - get_checkout: View current cart
@@ -139,10 +148,17 @@ class UCPToolkit(BaseModel):
         - complete_checkout: Place order
         - cancel_checkout: Cancel checkout
         - get_order: Get order status
+
+        The tools only hold a reference to the store, so they are built once
+        and shared; each call returns a new list.
         """
+        if self._tools is not None:
+            return list(self._tools)
+
         tool_classes = [
             SearchCatalogTool,
             AddToCheckoutTool,
+            AddManyToCheckoutTool,
             RemoveFromCheckoutTool,
             UpdateCheckoutTool,
             GetCheckoutTool,
@@ -153,15 +169,15 @@ class UCPToolkit(BaseModel):
             GetOrderTool,
         ]
 
-        tools = [
+        self._tools = [
             tool_class(store=self.store, verbose=self.verbose)
             for tool_class in tool_classes
         ]
 
         if self.verbose:
-            logger.debug(f"[UCPToolkit] Created {len(tools)} tools")
+            logger.debug(f"[UCPToolkit] Created {len(self._tools)} tools")
 
-        return tools
+        return list(self._tools)
 
     async def close(self) -> None:
         """Close the toolkit and release resources."""
@@ -99,6 +99,19 @@ class AddToCheckoutInput(BaseModel):
     quantity: int = Field(default=1, description="Quantity to add")
 
 
+class CheckoutItemInput(BaseModel):
+    """A product and quantity to add to checkout."""
+
+    product_id: str = Field(description="The product ID to add")
+    quantity: int = Field(default=1, description="Quantity to add")
+
+
+class AddManyToCheckoutInput(BaseModel):
+    """Input for adding several products to checkout at once."""
+
+    items: list[CheckoutItemInput] = Field(description="Products to add")
+
+
 class RemoveFromCheckoutInput(BaseModel):
     """Input for removing a product from checkout."""
 
@@ -253,6 +266,59 @@ class AddToCheckoutTool(UCPBaseTool):
             return f"Error adding to cart: {e}"
 
 
+class AddManyToCheckoutTool(UCPBaseTool):
+    """Tool for adding several products to the checkout session at once."""
+
+    name: str = "add_many_to_checkout"
+    description: str = (
+        "Adds several products to the checkout session in a single step. "
+        "Use this instead of repeated add_to_checkout calls when the user "
+        "asks for more than one product. "
+        "Use search_shopping_catalog first to find product IDs."
+    )
+    args_schema: Type[BaseModel] = AddManyToCheckoutInput
+
+    async def _arun(
+        self,
+        items: list[CheckoutItemInput | dict[str, Any]],
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+    ) -> str:
+        """Add many to checkout asynchronously."""
+        entries = [
+            item if isinstance(item, CheckoutItemInput)
+            else CheckoutItemInput.model_validate(item)
+            for item in items
+        ]
+        self._log(f"Adding {len(entries)} products")
+        try:
+            missing = [
+                entry.product_id
+                for entry in entries
+                if not self.store.get_product(entry.product_id)
+            ]
+            if missing:
+                self._log(f"Products not found: {missing}")
+                return (
+                    f"Products not found: {', '.join(missing)}. "
+                    "Use search_shopping_catalog to find available products."
+                )
+
+            checkout = await self.store.add_many_to_checkout(
+                [(entry.product_id, entry.quantity) for entry in entries]
+            )
+            self._log(f"Added to checkout_id={checkout.id}")
+            added = ", ".join(
+                f"{entry.quantity}x {self.store.get_product(entry.product_id).title}"
+                for entry in entries
+            )
+            return f"Added {added} to cart.\n\n{format_checkout_summary(checkout)}"
+        except ValueError as e:
+            return str(e)
+        except Exception as e:
+            logger.exception("Error adding to checkout")
+            return f"Error adding to cart: {e}"
+
+
 class RemoveFromCheckoutTool(UCPBaseTool):
     """Tool for removing a product from the checkout session."""
 
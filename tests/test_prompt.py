@@ -0,0 +1,27 @@
+"""Tests for A2UI JSON validation in langchain_ucp.a2ui.prompt."""
+
+import pytest
+
+from langchain_ucp.a2ui import validate_a2ui_json
+
+MESSAGES = '[{"beginRendering": {"surfaceId": "s", "root": "r"}}]'
+EXPECTED = [{"beginRendering": {"surfaceId": "s", "root": "r"}}]
+
+
+@pytest.mark.parametrize(
+    "json_string",
+    [
+        f"```json\n{MESSAGES}\n```",
+        f"```{MESSAGES}```",
+        f"  ```json {MESSAGES} ```  ",
+        MESSAGES,
+    ],
+    ids=["json-fence", "inline-fence", "padded-fence", "unfenced"],
+)
+def test_validate_strips_markdown_fences(json_string):
+    is_valid, parsed, error = validate_a2ui_json(json_string)
+
+    assert error is None
+    assert is_valid
+    assert parsed == EXPECTED
+
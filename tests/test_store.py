@@ -0,0 +1,74 @@
+"""Tests for optimistic checkout mutations in UCPStore."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from langchain_ucp.exceptions import UCPError, UCPValidationError
+from langchain_ucp.store import UCPStore
+
+
+class FakeClient:
+    """Client double that only serves checkout refetches."""
+
+    def __init__(self):
+        self.gets = 0
+
+    async def get_checkout(self, checkout_id):
+        self.gets += 1
+        return SimpleNamespace(id=checkout_id, line_items=[], fresh=True)
+
+
+def make_store(errors):
+    """Build a store with a cached checkout whose updates raise ``errors``."""
+    client = FakeClient()
+    store = UCPStore(client=client, products=[])
+    store.checkout_id = "co_1"
+    store._cache_checkout(SimpleNamespace(id="co_1", line_items=[], fresh=False))
+
+    updates = []
+
+    async def update_checkout_items(existing, line_items):
+        updates.append(existing)
+        if errors:
+            raise errors.pop(0)
+        return SimpleNamespace(id="co_1", line_items=line_items)
+
+    store._update_checkout_items = update_checkout_items
+    return store, client, updates
+
+
+@pytest.mark.parametrize("status_code", [409, 412])
+async def test_stale_update_refetches_and_retries_once(status_code):
+    store, client, updates = make_store([UCPError("stale", status_code=status_code)])
+
+    checkout = await store.remove_from_checkout("roses")
+
+    assert checkout.id == "co_1"
+    assert client.gets == 1
+    assert [u.fresh for u in updates] == [False, True]
+
+
+async def test_stale_update_is_retried_only_once():
+    store, client, updates = make_store(
+        [UCPError("stale", status_code=409), UCPError("stale", status_code=409)]
+    )
+
+    with pytest.raises(UCPError):
+        await store.remove_from_checkout("roses")
+
+    assert client.gets == 1
+    assert len(updates) == 2
+
+
+async def test_validation_error_is_raised_without_retry():
+    store, client, updates = make_store(
+        [UCPValidationError("invalid", status_code=422)]
+    )
+
+    with pytest.raises(UCPValidationError) as exc_info:
+        await store.remove_from_checkout("roses")
+
+    assert exc_info.value.status_code == 422
+    assert client.gets == 0
+    assert len(updates) == 1
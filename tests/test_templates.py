@@ -0,0 +1,91 @@
+"""Tests for the commerce A2UI templates."""
+
+import json
+
+import pytest
+
+from langchain_ucp.a2ui import A2UI_ARRAY_VALIDATOR
+from langchain_ucp.a2ui.templates import (
+    CheckoutTemplate,
+    OrderConfirmationTemplate,
+    ProductCardTemplate,
+    ProductListTemplate,
+    create_checkout_ui,
+    create_order_confirmation,
+    create_product_card,
+    create_product_list,
+)
+
+PRODUCT = {"id": "roses", "name": "Red Roses", "price": "$29.99", "imageUrl": ""}
+
+TEMPLATE_OUTPUTS = {
+    "product-card": lambda: create_product_card(
+        "roses", "Red Roses", "$29.99", "https://example.com/roses.jpg"
+    ),
+    "product-list": lambda: create_product_list("Flowers", [PRODUCT]),
+    "checkout": lambda: create_checkout_ui(
+        "co_1", [{"title": "Red Roses", "quantity": 2, "total": "$59.98"}], "$69.98"
+    ),
+    "order-confirmation": lambda: create_order_confirmation(
+        "ord_1", "2x Red Roses", "$59.98", "1 Main St"
+    ),
+}
+
+
+@pytest.mark.parametrize("build", TEMPLATE_OUTPUTS.values(), ids=TEMPLATE_OUTPUTS)
+def test_template_output_validates_in_memory(build):
+    A2UI_ARRAY_VALIDATOR.validate(build())
+
+
+def test_checkout_items_render_title_and_total():
+    data_update = TEMPLATE_OUTPUTS["checkout"]()[2]["dataModelUpdate"]
+    contents = {entry["key"]: entry for entry in data_update["contents"]}
+
+    item_entries = contents["items"]["valueMap"][0]["valueMap"]
+    item = {entry["key"]: entry["valueString"] for entry in item_entries}
+    assert item == {"title": "Red Roses", "quantity": "2", "total": "$59.98"}
+    assert contents["total"]["valueString"] == "$69.98"
+
+
+def _poison(value):
+    """Try to overwrite every string in a payload, skipping read-only parts."""
+    if isinstance(value, dict):
+        for key, child in value.items():
+            if isinstance(child, str):
+                try:
+                    value[key] = "poisoned"
+                except TypeError:
+                    pass
+            else:
+                _poison(child)
+    elif isinstance(value, list):
+        for child in value:
+            _poison(child)
+
+
+@pytest.mark.parametrize("build", TEMPLATE_OUTPUTS.values(), ids=TEMPLATE_OUTPUTS)
+def test_mutating_a_payload_does_not_affect_the_next_call(build):
+    expected = json.dumps(build())
+
+    _poison(build())
+
+    assert json.dumps(build()) == expected
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        ProductCardTemplate,
+        ProductListTemplate,
+        CheckoutTemplate,
+        OrderConfirmationTemplate,
+    ],
+)
+def test_shared_components_are_read_only_lists(template):
+    components = template.get_components()
+
+    assert isinstance(components, list)
+    with pytest.raises(TypeError):
+        components.append({})
+    with pytest.raises(TypeError):
+        components[0]["id"] = "changed"
@@ -0,0 +1,52 @@
+"""Tests for the A2UI data model types."""
+
+from langchain_ucp.a2ui import A2UIMessage, DataEntry
+from langchain_ucp.a2ui.types import DataModelUpdate
+
+WIRE_CONTENTS = [{"key": "a", "valueMap": [{"key": "b", "valueString": "y"}]}]
+
+
+def test_entry_accepts_field_names_and_aliases():
+    assert DataEntry(key="a", valueString="x") == DataEntry(key="a", value_string="x")
+
+
+def test_mixed_dict_children_are_validated_and_dumped():
+    update = DataModelUpdate(
+        surface_id="s",
+        contents=[DataEntry(key="a", value_map=[{"key": "b", "valueString": "y"}])],
+    )
+
+    assert update.contents[0].value_map == [DataEntry.string("b", "y")]
+    assert update.model_dump(by_alias=True, exclude_none=True)["contents"] == (
+        WIRE_CONTENTS
+    )
+
+
+def test_dump_without_alias_uses_field_names():
+    update = DataModelUpdate(surface_id="s", contents=WIRE_CONTENTS)
+
+    child = update.model_dump(exclude_none=True)["contents"][0]["value_map"][0]
+    assert child == {"key": "b", "value_string": "y"}
+
+
+def test_update_data_round_trips_wire_form():
+    entry = DataEntry.map("a", [DataEntry.string("b", "y")])
+    message = A2UIMessage.update_data("s", [entry])
+
+    assert entry.to_dict() == WIRE_CONTENTS[0]
+    assert A2UIMessage.model_validate(message.to_dict()) == message
+    assert message.to_dict()["dataModelUpdate"]["contents"] == WIRE_CONTENTS
+
+
+def test_deep_value_map_serializes_through_to_dict():
+    entry = DataEntry.string("leaf", "x")
+    for depth in range(3000):
+        entry = DataEntry.map(f"k{depth}", [entry])
+
+    message = A2UIMessage.update_data("s", [entry]).to_dict()
+
+    node = message["dataModelUpdate"]["contents"][0]
+    for depth in reversed(range(3000)):
+        assert node["key"] == f"k{depth}"
+        (node,) = node["valueMap"]
+    assert node == {"key": "leaf", "valueString": "x"}
@@ -0,0 +1,39 @@
+"""Generate langchain_ucp/a2ui/_compiled_validator.py from the A2UI schema.
+
+The generated module is a plain Python validator produced by
+``fastjsonschema.compile_to_code``, so importing it skips the schema compile
+step on every process start. Re-run this script whenever
+``A2UI_MESSAGE_SCHEMA`` changes:
+
+    python -m tools.compile_a2ui_schema
+"""
+
+from pathlib import Path
+
+import fastjsonschema
+
+from langchain_ucp.a2ui.schema import A2UI_MESSAGE_ARRAY_SCHEMA
+
+OUTPUT_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "langchain_ucp"
+    / "a2ui"
+    / "_compiled_validator.py"
+)
+
+HEADER = '''"""Compiled A2UI message array validator.
+
+Generated by tools/compile_a2ui_schema.py - do not edit by hand.
+"""
+# ruff: noqa
+'''
+
+
+def main() -> None:
+    code = fastjsonschema.compile_to_code(A2UI_MESSAGE_ARRAY_SCHEMA)
+    OUTPUT_PATH.write_text(HEADER + code, encoding="utf-8")
+    print(f"Wrote {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()